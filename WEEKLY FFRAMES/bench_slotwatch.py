@@ -0,0 +1,589 @@
+"""
+bench_slotwatch.py
+Micro-benchmarks for the watch's schedule data.
+
+Lookup: compares the compiled FrameIndex bisect lookup against the original per-tick
+linear scan, on the shipped frames and on a synthetic dense frame with hundreds of
+periods. Every lookup is cross-checked against the scan before timing, and the overnight,
+end-of-day and Sunday-into-Monday answers the scan can't give against hand-written ones.
+
+Memory (--memory): loads a synthetic corpus of frames (10k by default) from JSON and
+compares the retained size of the original dict-of-lists layout with schedule_model.Frame,
+then adds a FrameIndex per frame (before and after one lookup per frame).
+
+Suite (--suite): times the watch's hot paths headless -- hm_to_minutes, normalisation,
+index builds, find_prev_curr_next over every frame x weekday x minute, update_display
+and tick on a CreativeWatch built against fake tkinter modules, frame switches,
+show_full_schedule construction, and background decode/resize, plus a tick with --metrics
+on -- on the shipped frames and on synthetic scale-ups (--periods per frame, --frames
+frames loaded). Each case reports the median of --repeat samples (9) and their spread.
+Results can be written as JSON and are compared with a baseline JSON from an earlier run
+(bench_baseline.json next to this file unless --baseline says otherwise). A case whose
+median is over --tolerance times the baseline's is timed twice more, and the exit status
+is 1 if it stays over.
+
+The stored baseline was recorded with the default sizes and --repeat 15 on a single-CPU VM.
+There, medians of unchanged-tree runs differed by up to 2.1x between runs, but no case
+came out more than 1.39x slower than the baseline on its first timing or 1.16x after the
+re-timings (6 runs). The default tolerance of 1.5 sits above that, and an injected 2x
+lookup slowdown was still flagged. Re-record the baseline (--repeat 15 --json
+bench_baseline.json) on the hardware it will gate, and check those ratios there.
+
+Usage: python bench_slotwatch.py [--periods N] [--repeat R] [--memory [--frames N]]
+       python bench_slotwatch.py --suite [--periods N] [--frames N] [--json OUT] [--baseline FILE | --no-baseline]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+from itertools import count
+from types import SimpleNamespace
+
+from schedule_model import Frame, format_hm, hm_to_minutes, in_interval, normalise_periods
+from slotwatch_engine import FRAME_INDEX, FRAMES, MODULE_DIR, RAW_FRAMES, FrameIndex, LazyMapping
+
+BASELINE_FILE = os.path.join(MODULE_DIR, "bench_baseline.json")
+# default --tolerance: above the worst ratio between unchanged-tree suite runs seen on the
+# machine the baseline was recorded on (see the module docstring)
+TOLERANCE = 1.5
+
+
+# -----------------------------
+# Reference: the original linear scan from CreativeWatch.find_prev_curr_next
+# -----------------------------
+def scan_prev_curr_next(periods, now_minute: int, weekday_index: int):
+    prev_e = None
+    curr_e = None
+    next_e = None
+    for i, p in enumerate(periods):
+        activities = p["activities"]
+        activity = activities[weekday_index] if weekday_index < len(activities) else activities[0]
+        s = p["start_min"]
+        e = p["end_min"]
+        if in_interval(now_minute, s, e):
+            curr_e = (p["start"], p["end"], activity)
+            if i - 1 >= 0:
+                prev_p = periods[i-1]
+                prev_activity = prev_p["activities"][weekday_index] if weekday_index < len(prev_p["activities"]) else prev_p["activities"][0]
+                prev_e = (prev_p["start"], prev_p["end"], prev_activity)
+            if i + 1 < len(periods):
+                next_p = periods[i+1]
+                next_activity = next_p["activities"][weekday_index] if weekday_index < len(next_p["activities"]) else next_p["activities"][0]
+                next_e = (next_p["start"], next_p["end"], next_activity)
+            break
+        elif now_minute < s:
+            next_e = (p["start"], p["end"], activity)
+            if i - 1 >= 0:
+                prev_p = periods[i-1]
+                prev_activity = prev_p["activities"][weekday_index] if weekday_index < len(prev_p["activities"]) else prev_p["activities"][0]
+                prev_e = (prev_p["start"], prev_p["end"], prev_activity)
+            else:
+                prev_e = None
+            break
+        else:
+            prev_e = (p["start"], p["end"], activity)
+
+    if curr_e is None and next_e is None:
+        if periods:
+            last = periods[-1]
+            activities = last["activities"]
+            activity = activities[weekday_index] if weekday_index < len(activities) else activities[0]
+            if now_minute >= last["end_min"]:
+                prev_e = (last["start"], last["end"], activity)
+                next_e = None
+    return prev_e, curr_e, next_e
+
+
+def legacy_periods(frame):
+    """A Frame in the original normalised layout: one five-key dict per period."""
+    return [{"start_min": p.start_min, "end_min": p.end_min, "start": p.start, "end": p.end,
+             "activities": list(p.activities)} for p in frame]
+
+def legacy_normalise(periods):
+    """The original module-level normalisation loop, for one frame."""
+    new_periods = []
+    for p in periods:
+        start_min = hm_to_minutes(p["start"])
+        end_min = hm_to_minutes(p["end"])
+        if end_min <= start_min:
+            end_min += 24*60
+        new_periods.append({
+            "start_min": start_min,
+            "end_min": end_min,
+            "start": p["start"],
+            "end": p["end"],
+            "activities": p["activities"]
+        })
+    new_periods.sort(key=lambda x: x["start_min"])
+    return new_periods
+
+
+# -----------------------------
+# Synthetic data
+# -----------------------------
+def dense_frame(n_periods: int) -> Frame:
+    """Periods of equal length covering the day, with a one-minute gap after every third
+    (no gaps once periods are a single minute long, up to 1440 periods)."""
+    span = max(1, 1440 // n_periods)
+    periods = []
+    for i in range(n_periods):
+        start_min = i * span
+        end_min = start_min + span - (1 if i % 3 == 2 and span > 1 else 0)
+        if end_min > 1440:
+            break
+        periods.append((start_min, end_min, [f"Block {i} / day {d}" for d in range(7)]))
+    return Frame.from_periods("dense", periods)
+
+ACTIVITY_VOCAB = ["Devotion", "Callisthenics", "Cooking", "Cleaning", "Learning", "Help Brother",
+                  "Reflection", "Rest", "Family", "Planning", "Painting", "Drawing", "Writing",
+                  "Editing", "Coding", "Testing", "Upload", "Review", "Baking", "—"]
+
+def synthetic_corpus_json(n_frames: int, seed: int = 7) -> str:
+    """JSON text of `n_frames` frames shaped like the shipped ones (8-12 periods, 07:00-20:00)."""
+    rng = random.Random(seed)
+    frames = {}
+    for f in range(n_frames):
+        periods = []
+        minute = 7 * 60
+        for _ in range(rng.randint(8, 12)):
+            length = rng.choice((30, 45, 60, 90, 120))
+            main, weekend = rng.choice(ACTIVITY_VOCAB), rng.choice(ACTIVITY_VOCAB)
+            periods.append({"start": format_hm(minute), "end": format_hm(minute + length),
+                            "activities": [main] * 5 + [weekend, rng.choice(ACTIVITY_VOCAB)]})
+            minute += length + rng.choice((0, 0, 15))
+        frames[f"Frame {f}"] = periods
+    return json.dumps(frames)
+
+
+# -----------------------------
+# Runs
+# -----------------------------
+def check_equivalent(frame):
+    """FrameIndex must agree with the scan wherever the scan has an answer. Where the scan
+    gives None for prev/next (start/end of the day) the index carries on into the adjacent
+    day instead, and overnight periods are only compared on the day they start; those cases
+    are pinned by check_week_wrap."""
+    index = FrameIndex(frame)
+    periods = legacy_periods(frame)
+    overnight = any(p["end_min"] > 1440 for p in periods)
+    for weekday_index in range(7):
+        for now_min in range(1440):
+            expected = scan_prev_curr_next(periods, now_min, weekday_index)
+            got = index.lookup(now_min, weekday_index)
+            if overnight:
+                same = expected[1] is None or got[1] == expected[1]
+            else:
+                same = all(e is None or g == e for g, e in zip(got, expected)) and got[1] == expected[1]
+            if not same:
+                raise AssertionError(f"mismatch at {format_hm(now_min)} weekday {weekday_index}: {got} != {expected}")
+
+
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+def check_week_wrap():
+    """What the scan can't check: an overnight period stays current after midnight with the
+    day it started on, Sunday night runs on into Monday, and after the day's last period
+    next is the following day's first (Sunday's: Monday's)."""
+    def days(label):
+        return [f"{label} {day}" for day in DAY_NAMES]
+
+    night = FrameIndex(normalise_periods([
+        {"start": "06:30", "end": "08:00", "activities": days("Morning")},
+        {"start": "12:00", "end": "13:00", "activities": days("Lunch")},
+        {"start": "22:00", "end": "06:00", "activities": days("Night")},
+    ], "night"))
+    day = FrameIndex(normalise_periods([
+        {"start": "06:30", "end": "08:00", "activities": days("Morning")},
+        {"start": "12:00", "end": "13:00", "activities": days("Lunch")},
+    ], "day"))
+    cases = [
+        # (index, now, weekday, (prev, curr, next), current_index, next_boundary)
+        (night, "02:00", 0, (("12:00", "13:00", "Lunch Sun"), ("22:00", "06:00", "Night Sun"),
+                             ("06:30", "08:00", "Morning Mon")), None, 6*60),
+        (night, "02:00", 1, (("12:00", "13:00", "Lunch Mon"), ("22:00", "06:00", "Night Mon"),
+                             ("06:30", "08:00", "Morning Tue")), None, 6*60),
+        (night, "23:00", 6, (("12:00", "13:00", "Lunch Sun"), ("22:00", "06:00", "Night Sun"),
+                             ("06:30", "08:00", "Morning Mon")), 2, 1440 + 6*60),
+        (night, "06:30", 0, (("22:00", "06:00", "Night Sun"), ("06:30", "08:00", "Morning Mon"),
+                             ("12:00", "13:00", "Lunch Mon")), 0, 8*60),
+        (night, "06:15", 0, (("22:00", "06:00", "Night Sun"), None,
+                             ("06:30", "08:00", "Morning Mon")), None, 6*60 + 30),
+        (day, "20:00", 0, (("12:00", "13:00", "Lunch Mon"), None, ("06:30", "08:00", "Morning Tue")),
+         None, 1440 + 6*60 + 30),
+        (day, "20:00", 6, (("12:00", "13:00", "Lunch Sun"), None, ("06:30", "08:00", "Morning Mon")),
+         None, 1440 + 6*60 + 30),
+        (day, "00:30", 0, (("12:00", "13:00", "Lunch Sun"), None, ("06:30", "08:00", "Morning Mon")),
+         None, 6*60 + 30),
+    ]
+    for index, now, weekday_index, expected, current, boundary in cases:
+        now_min = hm_to_minutes(now)
+        where = f"{DAY_NAMES[weekday_index]} {now} ({'night' if index is night else 'day'} frame)"
+        got = index.lookup(now_min, weekday_index)
+        assert got == expected, f"lookup at {where}: {got} != {expected}"
+        got = index.current_index(now_min, weekday_index)
+        assert got == current, f"current_index at {where}: {got} != {current}"
+        got = index.next_boundary(now_min, weekday_index)
+        assert got == boundary, f"next_boundary at {where}: {got} != {boundary}"
+
+
+def per_lookup_ns(fn, repeat: int) -> float:
+    """Best-of-`repeat` mean cost of one lookup, sweeping every minute of one weekday."""
+    minutes = range(1440)
+
+    def sweep():
+        for now_min in minutes:
+            fn(now_min, 2)
+
+    best = min(timeit.repeat(sweep, number=1, repeat=repeat))
+    return best / len(minutes) * 1e9
+
+
+def bench_frame(label: str, frame, repeat: int):
+    check_equivalent(frame)
+    index = FrameIndex(frame)
+    periods = legacy_periods(frame)
+    scan_ns = per_lookup_ns(lambda m, d: scan_prev_curr_next(periods, m, d), repeat)
+    index_ns = per_lookup_ns(index.lookup, repeat)
+    print(f"{label:<48} {len(frame):>6} {scan_ns:>12.0f} {index_ns:>12.0f} {scan_ns / index_ns:>8.1f}x")
+
+
+def retained_bytes(text: str, build) -> int:
+    """Bytes still allocated after parsing `text` and building a layout from it (raw data dropped)."""
+    gc.collect()
+    tracemalloc.start()
+    raw = json.loads(text)
+    layout = build(raw)
+    del raw
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del layout
+    return size
+
+
+def bench_memory(n_frames: int):
+    text = synthetic_corpus_json(n_frames)
+    n_periods = sum(len(periods) for periods in json.loads(text).values())
+    legacy = retained_bytes(text, lambda raw: {name: legacy_normalise(p) for name, p in raw.items()})
+    compact = retained_bytes(text, lambda raw: {name: normalise_periods(p, name) for name, p in raw.items()})
+
+    def indexed(raw, lookup=False):
+        indexes = {name: FrameIndex(normalise_periods(p, name)) for name, p in raw.items()}
+        if lookup:
+            for index in indexes.values():
+                index.lookup(600, 2)
+        return indexes
+
+    index = retained_bytes(text, indexed) - compact
+    looked_up = retained_bytes(text, lambda raw: indexed(raw, lookup=True)) - compact
+    print(f"{n_frames} frames, {n_periods} periods")
+    print(f"{'dict-of-lists':<16} {legacy / 2**20:>9.1f} MiB {legacy / n_periods:>8.0f} B/period")
+    print(f"{'Frame columns':<16} {compact / 2**20:>9.1f} MiB {compact / n_periods:>8.0f} B/period")
+    print(f"{'ratio':<16} {legacy / compact:>9.1f}x")
+    print(f"{'+ FrameIndex':<16} {index / 2**20:>9.1f} MiB {index / n_periods:>8.0f} B/period")
+    print(f"{'  after lookup':<16} {looked_up / 2**20:>9.1f} MiB {looked_up / n_periods:>8.0f} B/period")
+
+# -----------------------------
+# Suite: fake widget layer
+# -----------------------------
+class FakeWidget:
+    """Stands in for any Tk widget or the root: accepts every call, remembers options, draws nothing."""
+    _ids = count(1)
+
+    def __init__(self, *args, **options):
+        self.options = dict(options)
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def winfo_width(self):
+        return 500
+
+    def winfo_height(self):
+        return 440
+
+    def canvasy(self, y):
+        return y
+
+    def create_rectangle(self, *args, **options):
+        return next(self._ids)
+
+    create_text = create_rectangle
+
+    def __getattr__(self, name):
+        # pack, bind, after, title, geometry, coords, itemconfigure, destroy, ...
+        return lambda *args, **options: None
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+class FakeFont:
+    """tkinter.font.Font stand-in: every character is 14 px wide."""
+
+    def __init__(self, *args, **options):
+        pass
+
+    def measure(self, text):
+        return 14 * len(text)
+
+# the modules slotwatch2 builds its widgets from; fake_tk() swaps these in for the suite
+FAKE_TK = SimpleNamespace(Toplevel=FakeWidget, Label=FakeWidget, Frame=FakeWidget, Canvas=FakeWidget,
+                          Scrollbar=FakeWidget, Button=FakeWidget, PhotoImage=FakeWidget, StringVar=FakeVar)
+FAKE_TTK = SimpleNamespace(Combobox=FakeWidget)
+FAKE_TKFONT = SimpleNamespace(Font=FakeFont)
+
+def fake_tk():
+    """slotwatch2, with FakeWidgets in place of tkinter for the rest of the process."""
+    import slotwatch2
+    slotwatch2.tk, slotwatch2.ttk, slotwatch2.tkfont = FAKE_TK, FAKE_TTK, FAKE_TKFONT
+    return slotwatch2
+
+def fake_watch(frame_name, metrics=False):
+    """A CreativeWatch built by its own constructor on FakeWidgets (no Tk, no display), switched
+    to FRAMES[frame_name] the way the selector does it."""
+    watch = fake_tk().CreativeWatch(FakeWidget(), metrics=metrics)
+    watch.frame_var.set(frame_name)
+    watch.on_select()
+    return watch
+
+# -----------------------------
+# Suite: cases
+# -----------------------------
+def median_seconds(fn, repeat: int):
+    """(median, max / min) of `repeat` samples of seconds per call; short cases are looped so
+    each sample lasts >= 0.2 s. The median shrugs off the odd sample a busy machine slows down."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    samples = sorted(t / number for t in timer.repeat(repeat=repeat, number=number))
+    return statistics.median(samples), samples[-1] / samples[0]
+
+def lookup_sweep(indexes, minutes=range(1440)):
+    def run():
+        for index in indexes:
+            lookup = index.lookup
+            for weekday_index in range(7):
+                for now_min in minutes:
+                    lookup(now_min, weekday_index)
+    return run
+
+def display_day(watch):
+    # one update_display per minute of a day; every call recomputes prev/current/next
+    day = datetime(2025, 10, 29)
+    moments = [day + timedelta(minutes=m) for m in range(1440)]
+
+    def run():
+        for now in moments:
+            watch.update_display(now)
+    return run
+
+def steady_ticks(watch, n=1000):
+    # ticks between boundaries: only the clock label is touched
+    def run():
+        watch._computed_at = datetime.now() - timedelta(days=1)
+        watch._recompute_at = datetime.now() + timedelta(days=1)
+        for _ in range(n):
+            watch.tick()
+    return run
+
+def popup_build(watch):
+    def run():
+        watch.show_full_schedule()
+        watch.close_full_schedule()
+    return run
+
+def frame_switches(watch, frame_names):
+    # what picking each frame in the selector costs: on_select, with every one of them indexed
+    def run():
+        for frame_name in frame_names:
+            watch.frame_var.set(frame_name)
+            watch.on_select()
+    return run
+
+def suite_cases(n_periods: int, n_frames: int):
+    """(name, callable, operations per call) for every case; cases needing PIL are skipped without it.
+
+    The dense frame and the synthetic corpus are added to FRAMES (as a schedule file's frames
+    would be), so the watch can select them and the corpus cases run with n_frames frames loaded.
+    """
+    hms = [p[key] for periods in RAW_FRAMES.values() for p in periods for key in ("start", "end")]
+    n_builtin = sum(len(periods) for periods in RAW_FRAMES.values())
+    builtin = {name: normalise_periods(periods, name) for name, periods in RAW_FRAMES.items()}
+    builtin_indexes = [FrameIndex(frame) for frame in builtin.values()]
+    first = next(iter(builtin))
+    corpus = json.loads(synthetic_corpus_json(n_frames))
+    n_corpus = sum(len(periods) for periods in corpus.values())
+    dense = dense_frame(n_periods)
+    dense_index = FrameIndex(dense)
+    dense_name = f"synthetic dense ({len(dense)} periods)"
+    FRAMES.maps.append({dense_name: dense})
+    FRAMES.maps.append(LazyMapping(corpus, lambda name: normalise_periods(corpus[name], name)))
+    corpus_names = list(corpus)
+    last = corpus_names[-1]
+    # every corpus frame indexed, as after a long session; lookups sample 15 minutes a day
+    corpus_indexes = [FRAME_INDEX[name] for name in corpus_names]
+    corpus_minutes = range(0, 1440, 97)
+    switch_names = corpus_names[::max(1, len(corpus_names) // 1000)]
+
+    cases = [
+        ("hm_to_minutes", lambda: [hm_to_minutes(hm) for hm in hms], len(hms)),
+        ("normalise/builtin", lambda: [normalise_periods(p, name) for name, p in RAW_FRAMES.items()], n_builtin),
+        ("index_build/builtin", lambda: [FrameIndex(frame) for frame in builtin.values()], len(builtin)),
+        ("lookup/builtin", lookup_sweep(builtin_indexes), len(builtin_indexes) * 7 * 1440),
+        ("update_display/builtin", display_day(fake_watch(first)), 1440),
+        ("tick/steady", steady_ticks(fake_watch(first)), 1000),
+        ("tick/steady_metrics", steady_ticks(fake_watch(first, metrics=True)), 1000),
+        ("show_full_schedule/builtin", popup_build(fake_watch(first)), 1),
+        (f"normalise/synthetic_{n_frames}_frames", lambda: [normalise_periods(p, name) for name, p in corpus.items()],
+         n_corpus),
+        (f"lookup/synthetic_{n_frames}_frames", lookup_sweep(corpus_indexes, corpus_minutes),
+         len(corpus_indexes) * 7 * len(corpus_minutes)),
+        (f"update_display/synthetic_{n_frames}_frames", display_day(fake_watch(last)), 1440),
+        (f"frame_switch/synthetic_{n_frames}_frames", frame_switches(fake_watch(last), switch_names),
+         len(switch_names)),
+        (f"show_full_schedule/synthetic_{n_frames}_frames", popup_build(fake_watch(last)), 1),
+        (f"index_build/dense_{len(dense)}", lambda: FrameIndex(dense), 1),
+        (f"lookup/dense_{len(dense)}", lookup_sweep([dense_index]), 7 * 1440),
+        (f"update_display/dense_{len(dense)}", display_day(fake_watch(dense_name)), 1440),
+        (f"show_full_schedule/dense_{len(dense)}", popup_build(fake_watch(dense_name)), 1),
+    ]
+
+    image = os.path.join(MODULE_DIR, "PURPLE3.JPG")
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("PIL not installed: skipping background cases", file=sys.stderr)
+        return cases
+    from slotwatch2 import WINDOW_SIZE, decode_background, prepare_background
+    cache_dir = tempfile.mkdtemp(prefix="slotwatch-bench-")
+    cases += [
+        ("background/decode_resize", lambda: decode_background(image, WINDOW_SIZE), 1),
+        # first call fills the temporary cache; the timed calls are the warm-start path
+        ("background/prepare_cached", lambda: prepare_background(image, WINDOW_SIZE, cache_dir), 1),
+    ]
+    return cases
+
+# -----------------------------
+# Suite: run / compare
+# -----------------------------
+def run_suite(n_periods: int, n_frames: int, repeat: int):
+    """(report, retime): the results, and retime(name) -> a fresh ns/op for one case."""
+    results = {}
+    cases = {}
+    print(f"{'case':<40} {'median s':>10} {'ns/op':>12} {'spread':>7}")
+    for name, fn, ops in suite_cases(n_periods, n_frames):
+        fn()  # warm up: lazy imports, caches, first-call allocations (autorange runs it again)
+        seconds, spread = median_seconds(fn, repeat)
+        cases[name] = (fn, ops)
+        results[name] = {"seconds": seconds, "ops": ops, "ns_per_op": seconds / ops * 1e9, "spread": spread}
+        print(f"{name:<40} {seconds:>10.4f} {seconds / ops * 1e9:>12.0f} {spread:>6.2f}x")
+
+    def retime(name):
+        fn, ops = cases[name]
+        return median_seconds(fn, repeat)[0] / ops * 1e9
+
+    report = {"python": platform.python_version(), "platform": platform.platform(),
+              "created": datetime.now().isoformat(timespec="seconds"),
+              "params": {"periods": n_periods, "frames": n_frames, "repeat": repeat},
+              "results": results}
+    return report, retime
+
+def compare_baseline(report, baseline, tolerance: float, retime=None, retries: int = 2):
+    """Print per-case ratios against `baseline`; returns the names of cases slower than `tolerance`.
+
+    A case over the tolerance is timed again (up to `retries` times, via retime) and only
+    counts if it stays over: a real slowdown repeats, a noisy sample usually doesn't.
+    """
+    sizes = {key: report["params"][key] for key in ("periods", "frames")}
+    if {key: baseline.get("params", {}).get(key) for key in sizes} != sizes:
+        print(f"note: baseline params {baseline.get('params')} differ from {report['params']}")
+    regressions = []
+    print(f"{'case':<40} {'baseline ns':>12} {'now ns':>12} {'ratio':>7}")
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<40} {'-':>12} {result['ns_per_op']:>12.0f}     new")
+            continue
+        now_ns = result["ns_per_op"]
+        tries = 0
+        while retime is not None and tries < retries and now_ns > tolerance * base["ns_per_op"]:
+            now_ns = min(now_ns, retime(name))
+            tries += 1
+        ratio = now_ns / base["ns_per_op"]
+        flag = "  REGRESSION" if ratio > tolerance else ""
+        retimed = "*" if tries else " "  # * : best of the first run and the re-timings
+        print(f"{name:<40} {base['ns_per_op']:>12.0f} {now_ns:>11.0f}{retimed} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schedule lookups (linear scan vs FrameIndex), "
+                                                 "memory, and the watch's hot paths.")
+    parser.add_argument("--periods", type=int, help="periods in the synthetic dense frame (default 480, suite 1000)")
+    parser.add_argument("--repeat", type=int,
+                        help="timing repeats (default 5: best is reported; suite 9: median is reported)")
+    parser.add_argument("--memory", action="store_true", help="run the memory comparison instead")
+    parser.add_argument("--frames", type=int, default=10_000, help="frames in the synthetic memory / suite corpus")
+    parser.add_argument("--suite", action="store_true", help="run the headless hot-path suite instead")
+    parser.add_argument("--json", metavar="OUT", help="suite: write results as JSON to OUT")
+    parser.add_argument("--baseline", metavar="FILE", default=BASELINE_FILE,
+                        help="suite: compare with results JSON from an earlier run (default: %(default)s)")
+    parser.add_argument("--no-baseline", action="store_true", help="suite: don't compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="suite: slowdown ratio vs the baseline that counts as a regression "
+                             "(default: %(default)s)")
+    args = parser.parse_args()
+
+    check_week_wrap()
+    if args.suite:
+        baseline = None
+        if not args.no_baseline:
+            # read first: a missing file fails fast, and --json may be about to overwrite it
+            try:
+                with open(args.baseline, encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except FileNotFoundError:
+                parser.exit(2, f"no baseline at {args.baseline}; record one with --json or pass --no-baseline\n")
+        report, retime = run_suite(args.periods or 1000, args.frames, args.repeat or 9)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        if baseline is not None:
+            regressions = compare_baseline(report, baseline, args.tolerance, retime)
+            if regressions:
+                print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+                sys.exit(1)
+        return
+
+    if args.memory:
+        bench_memory(args.frames)
+        return
+
+    print(f"{'frame':<48} {'periods':>6} {'scan ns':>12} {'index ns':>12} {'speedup':>9}")
+    for frame_name, frame in FRAMES.items():
+        bench_frame(frame_name, frame, args.repeat or 5)
+    periods = args.periods or 480
+    bench_frame(f"synthetic dense ({periods} periods)", dense_frame(periods), args.repeat or 5)
+
+
+if __name__ == "__main__":
+    main()
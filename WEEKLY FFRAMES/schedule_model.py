@@ -0,0 +1,126 @@
+"""
+schedule_model.py
+Compact in-memory representation of schedule frames.
+
+A Frame stores its periods as parallel columns: start/end minutes in array('H') and,
+per period, one shared 7-tuple of interned activity strings (Mon-Sun). Period is a
+two-slot view onto one row; its "HH:MM" strings are derived on demand with format_hm
+instead of being stored next to the minutes.
+"""
+
+import sys
+from array import array
+
+# -----------------------------
+# Utilities
+# -----------------------------
+def hm_to_minutes(hm: str) -> int:
+    """Convert 'HH:MM' to minutes since midnight."""
+    hh, mm = hm.split(":")
+    return int(hh) * 60 + int(mm)
+
+def in_interval(now_min: int, start_min: int, end_min: int) -> bool:
+    """Check inclusive start, exclusive end (so adjacent periods don't overlap)."""
+    return start_min <= now_min < end_min
+
+def format_hm(minutes: int) -> str:
+    hh = minutes // 60
+    mm = minutes % 60
+    return f"{hh:02d}:{mm:02d}"
+
+def format_end(end_min: int) -> str:
+    """Format an end minute; overnight ends (past 24:00) show as the next day's clock time."""
+    return format_hm(end_min - 24*60 if end_min > 24*60 else end_min)
+
+# identical Mon-Sun rows ("Cooking" x6 + "—") are shared between periods and frames
+_ACTIVITY_ROWS = {}
+
+def intern_activities(activities) -> tuple:
+    """Resolve `activities` to a shared 7-tuple of interned strings (short lists repeat their first)."""
+    row = tuple(sys.intern(activities[d] if d < len(activities) else activities[0]) for d in range(7))
+    return _ACTIVITY_ROWS.setdefault(row, row)
+
+# -----------------------------
+# Frame / Period
+# -----------------------------
+class Period:
+    """View of one period of a Frame."""
+    __slots__ = ("frame", "index")
+
+    def __init__(self, frame, index: int):
+        self.frame = frame
+        self.index = index
+
+    @property
+    def start_min(self) -> int:
+        return self.frame.starts[self.index]
+
+    @property
+    def end_min(self) -> int:
+        return self.frame.ends[self.index]
+
+    @property
+    def start(self) -> str:
+        return format_hm(self.frame.starts[self.index])
+
+    @property
+    def end(self) -> str:
+        return format_end(self.frame.ends[self.index])
+
+    @property
+    def activities(self) -> tuple:
+        return self.frame.activities[self.index]
+
+    def activity(self, weekday_index: int) -> str:
+        return self.frame.activities[self.index][weekday_index]
+
+    def __repr__(self):
+        return f"Period({self.start}-{self.end}, {self.activities[0]!r}, ...)"
+
+class Frame:
+    """One schedule frame: periods sorted by start, as parallel columns."""
+    __slots__ = ("name", "starts", "ends", "activities")
+
+    def __init__(self, name: str = "", starts=None, ends=None, activities=None):
+        self.name = name
+        self.starts = starts if starts is not None else array("H")  # start_min per period
+        self.ends = ends if ends is not None else array("H")        # end_min, > 1440 if overnight
+        self.activities = activities if activities is not None else []  # interned Mon-Sun 7-tuples
+
+    @classmethod
+    def from_periods(cls, name: str, periods):
+        """Build from (start_min, end_min, activities) triples, in any order."""
+        rows = sorted(periods, key=lambda p: p[0])
+        return cls(name,
+                   array("H", [p[0] for p in rows]),
+                   array("H", [p[1] for p in rows]),
+                   [intern_activities(p[2]) for p in rows])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.starts)
+        if not 0 <= i < len(self.starts):
+            raise IndexError("period index out of range")
+        return Period(self, i)
+
+    def __iter__(self):
+        for i in range(len(self.starts)):
+            yield Period(self, i)
+
+    def __repr__(self):
+        return f"Frame({self.name!r}, {len(self)} periods)"
+
+def normalise_periods(periods, name: str = "") -> Frame:
+    """Convert raw {start, end, activities} periods to a Frame of minute ranges, sorted by start."""
+    rows = []
+    for p in periods:
+        start_min = hm_to_minutes(p["start"])
+        end_min = hm_to_minutes(p["end"])
+        # guard: if end <= start (overnight), treat end as next day
+        if end_min <= start_min:
+            end_min += 24*60
+        rows.append((start_min, end_min, p["activities"]))
+    return Frame.from_periods(name, rows)
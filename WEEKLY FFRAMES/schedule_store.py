@@ -0,0 +1,431 @@
+"""
+schedule_store.py
+Loads extra schedule frames from a directory of JSON / TOML files.
+
+Each file holds one or more frames, in the same shape as RAW_FRAMES in slotwatch_engine.py:
+
+    {"frames": {"🌙 Night Shift Frame": [
+        {"start": "22:00", "end": "06:00", "activities": ["Shift", "Shift", ...]}
+    ]}}
+
+or in TOML:
+
+    [[frames."🌙 Night Shift Frame"]]
+    start = "22:00"
+    end = "06:00"
+    activities = ["Shift", "Shift", ...]
+
+Every file is validated once and compiled into a compact binary cache (array-backed
+minute ranges plus an interned string table). Later loads memory-map the cache and
+only read the frame names; a frame's periods are decoded the first time it is looked
+up. A cache entry is rebuilt when its source file's mtime or size changes, and
+ScheduleStore.poll() re-reads files edited while the app is running.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from hashlib import sha1
+
+from schedule_model import Frame, intern_activities
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+SCHEDULE_SUFFIXES = (".json", ".toml")
+
+# -----------------------------
+# Validation
+# -----------------------------
+class ScheduleError(ValueError):
+    """A schedule file that can't be parsed or doesn't describe valid frames."""
+
+_HM_RE = re.compile(r"^(\d{1,2}):(\d{2})$")
+
+def _parse_hm(value, where: str) -> int:
+    match = _HM_RE.match(value) if isinstance(value, str) else None
+    if not match:
+        raise ScheduleError(f"{where}: expected 'HH:MM', got {value!r}")
+    minutes = int(match.group(1)) * 60 + int(match.group(2))
+    if int(match.group(2)) >= 60 or minutes > 24*60:
+        raise ScheduleError(f"{where}: {value!r} is not a time of day")
+    return minutes
+
+def validate_frames(data, source: str = "<schedule>"):
+    """Check parsed file contents and return {frame name: periods} for write_compiled.
+
+    Periods are dicts with start_min/end_min/activities, sorted by start, with overnight
+    periods ending past 24:00.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("frames"), dict):
+        raise ScheduleError(f"{source}: expected a top-level 'frames' table")
+    frames = {}
+    for frame_name, periods in data["frames"].items():
+        if not isinstance(periods, list):
+            raise ScheduleError(f"{source}: frame {frame_name!r} must be a list of periods")
+        new_periods = []
+        for i, p in enumerate(periods):
+            where = f"{source}: {frame_name!r} period {i}"
+            if not isinstance(p, dict):
+                raise ScheduleError(f"{where}: expected a table with start, end, activities")
+            start_min = _parse_hm(p.get("start"), f"{where} start")
+            end_min = _parse_hm(p.get("end"), f"{where} end")
+            # same rule as normalise_periods: end <= start means the period runs past midnight
+            if end_min <= start_min:
+                end_min += 24*60
+            activities = p.get("activities")
+            if (not isinstance(activities, list) or not 1 <= len(activities) <= 7
+                    or not all(isinstance(a, str) for a in activities)):
+                raise ScheduleError(f"{where}: activities must be a list of 1-7 strings (Mon-Sun)")
+            new_periods.append({
+                "start_min": start_min,
+                "end_min": end_min,
+                "activities": activities,
+            })
+        new_periods.sort(key=lambda x: x["start_min"])
+        frames[frame_name] = new_periods
+    return frames
+
+def parse_schedule_file(path: str):
+    """Read and validate one JSON/TOML schedule file."""
+    try:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ScheduleError(f"{path}: TOML schedules need Python 3.11+ or the 'tomli' package")
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+    except (OSError, ValueError) as exc:
+        if isinstance(exc, ScheduleError):
+            raise
+        raise ScheduleError(f"{path}: {exc}") from exc
+    return validate_frames(data, path)
+
+# -----------------------------
+# Binary cache
+#
+# header | string offsets (u32 x n_strings+1) | utf-8 string blob (padded to 4)
+#        | frame table (u32 x 3 per frame: name id, first period, period count)
+#        | activity ids (u32 x 7 per period, Mon-Sun, short lists already padded)
+#        | start minutes (u16 per period) | end minutes (u16 per period)
+#
+# Arrays are in native byte order; the header records which, and a mismatch is a stale cache.
+# -----------------------------
+_MAGIC = b"SWSC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB2xqqIII")  # magic, version, big-endian flag, mtime_ns, size, counts
+_BIG_ENDIAN = 1 if sys.byteorder == "big" else 0
+
+def _pad4(n: int) -> int:
+    return (n + 3) & ~3
+
+def write_compiled(frames, cache_file: str, mtime_ns: int, size: int):
+    """Write {frame name: periods} (as from validate_frames) to `cache_file`, atomically."""
+    string_ids = {}
+    strings = []
+
+    def intern(s):
+        sid = string_ids.get(s)
+        if sid is None:
+            sid = string_ids[s] = len(strings)
+            strings.append(s)
+        return sid
+
+    frame_table = array("I")
+    activity_ids = array("I")
+    starts = array("H")
+    ends = array("H")
+    for frame_name, periods in frames.items():
+        frame_table.extend((intern(frame_name), len(starts), len(periods)))
+        for p in periods:
+            starts.append(p["start_min"])
+            ends.append(p["end_min"])
+            activities = p["activities"]
+            # resolve the Mon-Sun fallback (short lists repeat their first entry) once, here
+            activity_ids.extend(intern(activities[d] if d < len(activities) else activities[0]) for d in range(7))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    for b in encoded:
+        offsets.append(offsets[-1] + len(b))
+    blob = b"".join(encoded)
+
+    header = _HEADER.pack(_MAGIC, _VERSION, _BIG_ENDIAN, mtime_ns, size,
+                          len(strings), len(frame_table) // 3, len(starts))
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(header)
+        f.write(offsets.tobytes())
+        f.write(blob)
+        f.write(b"\0" * (_pad4(len(blob)) - len(blob)))
+        f.write(frame_table.tobytes())
+        f.write(activity_ids.tobytes())
+        f.write(starts.tobytes())
+        f.write(ends.tobytes())
+    os.replace(tmp_file, cache_file)
+
+class _CompiledView:
+    """Memory-mapped sections of one cache file. Use as a context manager; nothing outlives it."""
+
+    def __init__(self, cache_file: str):
+        with open(cache_file, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mm) < _HEADER.size:
+                raise ValueError("truncated")
+            (magic, version, big_endian, self.mtime_ns, self.size,
+             n_strings, n_frames, n_periods) = _HEADER.unpack_from(self._mm, 0)
+            if magic != _MAGIC or version != _VERSION or big_endian != _BIG_ENDIAN:
+                raise ValueError("wrong format")
+            view = self._view = memoryview(self._mm)
+            pos = _HEADER.size
+
+            def section(fmt, count, itemsize):
+                nonlocal pos
+                part = view[pos:pos + count * itemsize].cast(fmt)
+                if len(part) != count:
+                    raise ValueError("truncated")
+                pos += count * itemsize
+                return part
+
+            self.offsets = section("I", n_strings + 1, 4)
+            self.blob = view[pos:pos + self.offsets[-1]]
+            pos += _pad4(self.offsets[-1])
+            self.frame_table = section("I", n_frames * 3, 4)
+            self.activity_ids = section("I", n_periods * 7, 4)
+            self.starts = section("H", n_periods, 2)
+            self.ends = section("H", n_periods, 2)
+            self.n_frames = n_frames
+        except (ValueError, struct.error):
+            self.close()
+            raise
+
+    def string(self, sid: int) -> str:
+        return sys.intern(str(self.blob[self.offsets[sid]:self.offsets[sid + 1]], "utf-8"))
+
+    def frame_names(self):
+        return [self.string(self.frame_table[3 * i]) for i in range(self.n_frames)]
+
+    def frame(self, frame_pos: int) -> Frame:
+        """Decode one frame; the minute columns are copied out of the map as array('H')."""
+        name_id, first, count = self.frame_table[3 * frame_pos:3 * frame_pos + 3]
+        ids = self.activity_ids
+        return Frame(self.string(name_id),
+                     array("H", self.starts[first:first + count]),
+                     array("H", self.ends[first:first + count]),
+                     [intern_activities([self.string(sid) for sid in ids[7 * k:7 * k + 7]])
+                      for k in range(first, first + count)])
+
+    def close(self):
+        for name in ("offsets", "blob", "frame_table", "activity_ids", "starts", "ends", "_view"):
+            part = self.__dict__.pop(name, None)
+            if part is not None:
+                part.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------
+# Store
+# -----------------------------
+class ScheduleStore(Mapping):
+    """Frame name -> schedule_model.Frame for every schedule file in `directory`.
+
+    The directory is scanned on first use; files that fail validation are reported on
+    stderr and skipped. When two files define the same frame name the first file (in
+    name order) wins. `cache_dir` belongs to this directory: compiled files whose source
+    is gone are deleted from it.
+    """
+
+    def __init__(self, directory: str, cache_dir: str):
+        self.directory = directory
+        self.cache_dir = cache_dir
+        self._sources = {}
+        self._locations = None  # frame name -> (cache file, position in file)
+        self._frames = {}
+
+    def cache_path(self, source: str) -> str:
+        stem = os.path.splitext(os.path.basename(source))[0]
+        digest = sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{stem}-{digest}.swsc")
+
+    def _compiled_names(self, source: str, mtime_ns: int, size: int):
+        """Frame names in `source`, recompiling its cache first if it is missing or stale."""
+        cache_file = self.cache_path(source)
+        try:
+            with _CompiledView(cache_file) as view:
+                if view.mtime_ns == mtime_ns and view.size == size:
+                    return cache_file, view.frame_names()
+        except (OSError, ValueError):
+            pass
+        frames = parse_schedule_file(source)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        write_compiled(frames, cache_file, mtime_ns, size)
+        return cache_file, list(frames)
+
+    def _remove_caches(self, cache_files):
+        for cache_file in cache_files:
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+
+    def _remove_orphan_caches(self, sources):
+        """Delete compiled files in cache_dir that belong to none of `sources` (files removed
+        while the app wasn't running, or renamed)."""
+        keep = {self.cache_path(source) for source in sources}
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        self._remove_caches(os.path.join(self.cache_dir, name) for name in names
+                            if name.endswith(".swsc") and os.path.join(self.cache_dir, name) not in keep)
+
+    def _stat_sources(self):
+        """{source: (mtime_ns, size)} for every schedule file in the directory, in name order."""
+        try:
+            entries = sorted((e for e in os.scandir(self.directory) if e.name.endswith(SCHEDULE_SUFFIXES)),
+                             key=lambda e: e.name)
+        except OSError:
+            return {}  # no schedule directory: only the built-in frames
+        stats = {}
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            stats[entry.path] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    @staticmethod
+    def _locate(sources):
+        locations = {}
+        for mtime_ns, size, cache_file, frame_names in sources.values():
+            for pos, frame_name in enumerate(frame_names):
+                locations.setdefault(frame_name, (cache_file, pos))
+        return locations
+
+    def _scan(self):
+        # source -> (mtime_ns, size, cache file, frame names); a bad file is kept with no
+        # frames so poll() doesn't re-read it until it changes again
+        sources = {}
+        stats = self._stat_sources()
+        for source, (mtime_ns, size) in stats.items():
+            try:
+                cache_file, frame_names = self._compiled_names(source, mtime_ns, size)
+            except (OSError, ScheduleError) as exc:
+                print(f"skipping schedule file: {exc}", file=sys.stderr)
+                sources[source] = (mtime_ns, size, None, [])
+                continue
+            sources[source] = (mtime_ns, size, cache_file, frame_names)
+        self._sources = sources
+        self._locations = self._locate(sources)
+        self._remove_orphan_caches(stats)
+
+    def poll(self):
+        """Pick up schedule files added, changed or removed since the last scan.
+
+        Returns (names of frames that changed, appeared or disappeared; [(source, mtime_ns)]
+        of the files re-read). Only files whose mtime or size moved are parsed again, and a
+        loaded frame whose periods came out identical keeps its old object and is not
+        reported. A file that no longer parses keeps its previous frames (error on stderr).
+        """
+        if self._locations is None:
+            self._scan()
+            return set(), []
+        stats = self._stat_sources()
+        old_sources = self._sources
+        if stats.keys() == old_sources.keys() and all(old_sources[s][:2] == st for s, st in stats.items()):
+            return set(), []
+
+        sources = {}
+        reread = []
+        for source, (mtime_ns, size) in stats.items():
+            old = old_sources.get(source)
+            if old is not None and old[:2] == (mtime_ns, size):
+                sources[source] = old
+                continue
+            try:
+                cache_file, frame_names = self._compiled_names(source, mtime_ns, size)
+            except (OSError, ScheduleError) as exc:
+                if old is not None and old[2] is not None:
+                    # the old cache file is only replaced after a successful parse
+                    print(f"keeping previous version of schedule file: {exc}", file=sys.stderr)
+                    sources[source] = (mtime_ns, size, old[2], old[3])
+                else:
+                    print(f"skipping schedule file: {exc}", file=sys.stderr)
+                    sources[source] = (mtime_ns, size, None, [])
+                continue
+            sources[source] = (mtime_ns, size, cache_file, frame_names)
+            reread.append((source, mtime_ns))
+
+        locations = self._locate(sources)
+        rewritten = {sources[source][2] for source, _ in reread}
+        frames = {}
+        changed = set()
+        for frame_name in self._locations.keys() | locations.keys():
+            location = locations.get(frame_name)
+            old_frame = self._frames.get(frame_name)
+            if location is None:
+                changed.add(frame_name)
+            elif location == self._locations.get(frame_name) and location[0] not in rewritten:
+                if old_frame is not None:
+                    frames[frame_name] = old_frame
+            elif old_frame is None:
+                changed.add(frame_name)  # never loaded: nothing to compare, decoded on next access
+            else:
+                with _CompiledView(location[0]) as view:
+                    frame = view.frame(location[1])
+                if (frame.starts, frame.ends, frame.activities) == (old_frame.starts, old_frame.ends,
+                                                                     old_frame.activities):
+                    frames[frame_name] = old_frame
+                else:
+                    frames[frame_name] = frame
+                    changed.add(frame_name)
+        # swap everything at once so readers never see half a reload
+        self._sources, self._locations, self._frames = sources, locations, frames
+        # deleted files take their compiled caches with them
+        self._remove_caches(self.cache_path(source) for source in old_sources.keys() - stats.keys())
+        return changed, reread
+
+    def __getitem__(self, frame_name):
+        if self._locations is None:
+            self._scan()
+        try:
+            return self._frames[frame_name]
+        except KeyError:
+            cache_file, pos = self._locations[frame_name]
+        with _CompiledView(cache_file) as view:
+            frame = self._frames[frame_name] = view.frame(pos)
+        return frame
+
+    def __contains__(self, frame_name):
+        if self._locations is None:
+            self._scan()
+        return frame_name in self._locations
+
+    def __iter__(self):
+        if self._locations is None:
+            self._scan()
+        return iter(self._locations)
+
+    def __len__(self):
+        if self._locations is None:
+            self._scan()
+        return len(self._locations)
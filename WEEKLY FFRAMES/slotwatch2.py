@@ -1,245 +1,465 @@
 """
 creative_watch_full.py
-Single-file Tkinter GUI that shows a 24h clock and daily routine frames.
+Tkinter GUI that shows a 24h clock and daily routine frames.
 Theme: Minimalist dark with neon green / teal / emerald hues.
 Shows previous, current, and next scheduled activity for the selected frame.
 
-No external files required.
+Needs PURPLE3.JPG next to this file; a window-sized copy is cached under ~/.cache/slotwatch.
+Extra frames can be dropped into ./schedules (or $SLOTWATCH_SCHEDULES) as JSON/TOML files.
+--reload SECONDS polls that directory and swaps edited frames in without a restart.
+--metrics shows a timing overlay (F9) and, with --metrics-file, exports tick/render metrics.
+--alert MINUTES (repeatable) flashes the current-activity panel that long before each period starts.
+--ambient / --ambient-hours HH:MM-HH:MM drop to a minute clock on a plain background during
+free time / those hours.
+--dashboard [FRAME ...] shows many frames at once as a grid of cards on one shared clock.
 """
 
+from time import perf_counter, time_ns
+STARTUP_T0 = perf_counter()  # reference point for --startup-timing
+
+import argparse
+import heapq
+import math
+import os
+import queue
+import sys
+import threading
 import tkinter as tk
-from PIL import Image, ImageTk
+import tkinter.font as tkfont
+from collections import OrderedDict
 from tkinter import ttk
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
+
+from schedule_model import Frame, hm_to_minutes, in_interval
+from slotwatch_engine import (CACHE_DIR, DAY_MINUTES, FRAME_INDEX, FRAMES, MODULE_DIR, WEEK_MINUTES,
+                              FrameIndex, TransitionTimeline, reload_frames, resolve_frame)
+from slotwatch_metrics import Metrics
+
+# -----------------------------
+# Render layer
+# Tk re-lays out and redraws a widget on every .config() call, even when nothing changed.
+# -----------------------------
+class RenderCache:
+    """Remembers the options last sent to each widget and forwards only the changed ones."""
+
+    def __init__(self):
+        self._last = {}
+        self.applied = 0   # config calls that reached Tk
+        self.skipped = 0   # config calls dropped because nothing changed
+
+    def config(self, widget, **options) -> bool:
+        last = self._last.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if k not in last or last[k] != v}
+        if not changed:
+            self.skipped += 1
+            return False
+        widget.config(**changed)
+        last.update(changed)
+        self.applied += 1
+        return True
+
+    def forget(self, widget=None):
+        """Drop remembered state (for one widget, or all) after it was changed behind our back."""
+        if widget is None:
+            self._last.clear()
+        else:
+            self._last.pop(widget, None)
+
+    def stats(self) -> dict:
+        return {"applied": self.applied, "skipped": self.skipped}
+
+# -----------------------------
+# Label text cache
+# What the prev/current/next labels say is fixed per (frame, weekday, period), and so is
+# where the 25pt current-activity text wraps. Both are built once and kept in an LRU; the
+# wrap is done here with memoized word widths and handed to Tk as explicit lines, so Tk's
+# own wrap at wraplength finds nothing left to break. The cache is warmed at idle time.
+# -----------------------------
+class TextWrapper:
+    """Greedy word wrap to `width` pixels in a Tk font; each word is measured once."""
+
+    def __init__(self, font, width: int):
+        self.font = font
+        self.width = width
+        self._widths = {}
+        self.space = font.measure(" ")
+
+    def measure(self, word: str) -> int:
+        width = self._widths.get(word)
+        if width is None:
+            width = self._widths[word] = self.font.measure(word)
+        return width
+
+    def wrap(self, text: str) -> str:
+        lines = []
+        for paragraph in text.split("\n"):
+            line, line_width = "", 0
+            for word in paragraph.split():
+                word_width = self.measure(word)
+                if line and line_width + self.space + word_width > self.width:
+                    lines.append(line)
+                    line, line_width = word, word_width
+                elif line:
+                    line, line_width = f"{line} {word}", line_width + self.space + word_width
+                else:
+                    line, line_width = word, word_width
+            lines.append(line)
+        return "\n".join(lines)
+
+class LabelTextCache:
+    """LRU of (prev text, current text, next text, in a period) keyed by (frame index, weekday,
+    period, in a period). `wrapper` (a TextWrapper) pre-wraps the current text; None leaves it."""
+
+    def __init__(self, wrapper=None, capacity: int = 4096):
+        self.wrapper = wrapper
+        self.capacity = capacity
+        self._texts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def texts(self, index, now_minute: int, weekday_index: int):
+        located = index.locate(now_minute, weekday_index)
+        if located is None:
+            key = (index, None)
+        else:
+            j, current = located
+            key = (index, j // index.n_periods, j % index.n_periods, current)
+        texts = self._texts.get(key)
+        if texts is not None:
+            self._texts.move_to_end(key)
+            self.hits += 1
+            return texts
+        self.misses += 1
+        texts = self._texts[key] = self._format(index, located)
+        if len(self._texts) > self.capacity:
+            self._texts.popitem(last=False)
+        return texts
+
+    def reserve(self, n: int):
+        """Grow the capacity to at least `n`, so that n texts looked up in a row all stay cached."""
+        self.capacity = max(self.capacity, n)
+
+    def _format(self, index, located):
+        if located is None:
+            return "⤴ Previous: —", "Free / Unscheduled Time", "⤵ Next: —", False
+        j, current = located
+        pst, pet, pact = index.entry(j - 1)
+        prev_text = f"⤴ Previous: {pact}  ({pst}–{pet})"
+        if current:
+            cst, cet, cact = index.entry(j)
+            current_text = f"{cact}\n\n({cst}–{cet})"
+            if self.wrapper is not None:
+                current_text = self.wrapper.wrap(current_text)
+            nst, net, nact = index.entry(j + 1)
+        else:
+            current_text = "Free / Unscheduled Time"
+            nst, net, nact = index.entry(j)
+        return prev_text, current_text, f"⤵ Next: {nact}  ({nst}–{net})", current
+
+# -----------------------------
+# Schedule popup list
+# Rows are drawn straight onto the Canvas and only the ones in view exist; the item pool
+# is recycled as the canvas scrolls, so a frame with hundreds of periods opens instantly.
+# -----------------------------
+class ScheduleList:
+    """Virtualized list of (start, end, activity) rows on a Canvas, with one highlighted row."""
+
+    ROW_HEIGHT = 44
+
+    def __init__(self, canvas, bg, time_fg, activity_fg, highlight_bg):
+        self.canvas = canvas
+        self.bg = bg
+        self.time_fg = time_fg
+        self.activity_fg = activity_fg
+        self.highlight_bg = highlight_bg
+        self.entries = ()
+        self.current = None
+        self._width = 0
+        # pool of [rect, time text, activity text, (row, highlighted) currently drawn or None]
+        self._slots = []
+        canvas.configure(yscrollincrement=self.ROW_HEIGHT)
+        canvas.bind("<Configure>", lambda event: self.redraw())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(sequence, self._on_wheel)
+
+    def set_entries(self, entries, current=None):
+        """Show `entries`; repaints only what changed (nothing, if it's the same day and row)."""
+        if entries is not self.entries:
+            self.entries = entries
+            self.current = current
+            self.canvas.configure(scrollregion=(0, 0, self._width, len(entries) * self.ROW_HEIGHT))
+            for slot in self._slots:
+                slot[3] = None
+            self.redraw()
+        elif current != self.current:
+            self.current = current
+            self.redraw()
+
+    def yview(self, *args):
+        # scrollbar command
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def _on_wheel(self, event):
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.canvas.yview_scroll(step, "units")
+        self.redraw()
+
+    def redraw(self):
+        canvas = self.canvas
+        width = canvas.winfo_width()
+        if width != self._width:
+            # rects and wrap width depend on it: repaint every slot
+            self._width = width
+            canvas.configure(scrollregion=(0, 0, width, len(self.entries) * self.ROW_HEIGHT))
+            for slot in self._slots:
+                slot[3] = None
+        first = max(0, int(canvas.canvasy(0)) // self.ROW_HEIGHT)
+        count = max(0, min(len(self.entries) - first, canvas.winfo_height() // self.ROW_HEIGHT + 2))
+        while len(self._slots) < count:
+            self._slots.append([
+                canvas.create_rectangle(0, 0, 0, 0, width=0, state="hidden"),
+                canvas.create_text(0, 0, anchor="w", fill=self.time_fg, font=("Segoe UI", 10), state="hidden"),
+                canvas.create_text(0, 0, anchor="w", fill=self.activity_fg, font=("Segoe UI", 11),
+                                   justify="left", state="hidden"),
+                None,
+            ])
+        for k, slot in enumerate(self._slots):
+            rect, time_item, activity_item, drawn = slot
+            if k >= count:
+                if drawn is not None:
+                    for item in (rect, time_item, activity_item):
+                        canvas.itemconfigure(item, state="hidden")
+                    slot[3] = None
+                continue
+            row = first + k
+            state = (row, row == self.current)
+            if drawn == state:
+                continue
+            start, end, activity = self.entries[row]
+            y = row * self.ROW_HEIGHT
+            mid = y + self.ROW_HEIGHT // 2
+            canvas.coords(rect, 6, y + 2, width - 6, y + self.ROW_HEIGHT - 2)
+            canvas.itemconfigure(rect, fill=self.highlight_bg if state[1] else self.bg, state="normal")
+            canvas.coords(time_item, 14, mid)
+            canvas.itemconfigure(time_item, text=f"{start}–{end}", state="normal")
+            canvas.coords(activity_item, 124, mid)
+            canvas.itemconfigure(activity_item, text=activity, width=max(width - 140, 60), state="normal")
+            slot[3] = state
 
 # -----------------------------
-# Utilities
+# Background image
+# The 4 MB source JPEG is decoded at reduced scale (draft mode), resized to the window once,
+# and kept as a PPM that Tk reads natively, so later launches skip decode and resize entirely.
 # -----------------------------
-def hm_to_minutes(hm: str) -> int:
-    """Convert 'HH:MM' to minutes since midnight."""
-    hh, mm = hm.split(":")
-    return int(hh) * 60 + int(mm)
+BG_IMAGE_PATH = os.path.join(MODULE_DIR, "PURPLE3.JPG")
+WINDOW_SIZE = (1200, 850)
+BG_CACHE_DIR = CACHE_DIR
 
-def in_interval(now_min: int, start_min: int, end_min: int) -> bool:
-    """Check inclusive start, exclusive end (so adjacent periods don't overlap)."""
-    return start_min <= now_min < end_min
+def background_cache_path(path: str, size, cache_dir: str = BG_CACHE_DIR) -> str:
+    """Cache file for `path` scaled to `size`, keyed by the source's mtime."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{os.stat(path).st_mtime_ns}-{size[0]}x{size[1]}.ppm")
 
-def format_hm(minutes: int) -> str:
-    hh = minutes // 60
-    mm = minutes % 60
-    return f"{hh:02d}:{mm:02d}"
+def decode_background(path: str, size):
+    """Decode `path` no larger than needed for `size` and resize it to exactly `size`."""
+    from PIL import Image  # only needed on a cache miss
+    image = Image.open(path)
+    # JPEG draft picks the smallest DCT scale (1/2, 1/4, 1/8) that is still >= size
+    image.draft("RGB", size)
+    return image.convert("RGB").resize(size, Image.LANCZOS)
+
+def prepare_background(path: str = BG_IMAGE_PATH, size=WINDOW_SIZE, cache_dir: str = BG_CACHE_DIR):
+    """Everything but the Tk part of loading the background, so it can run on a worker thread.
+
+    Returns the cache file path, or a PIL image if the cache dir can't be written.
+    """
+    cache_file = background_cache_path(path, size, cache_dir)
+    if os.path.exists(cache_file):
+        return cache_file
+    image = decode_background(path, size)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        image.save(tmp_file, "PPM")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # read-only or full cache dir: still show the image, just don't cache it
+        return image
+    # drop entries for older versions / other sizes of the same source
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for name in os.listdir(cache_dir):
+        stale = os.path.join(cache_dir, name)
+        if name.startswith(f"{stem}-") and stale != cache_file:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+    return cache_file
+
+def background_photo(master, prepared):
+    """PhotoImage from prepare_background()'s result; must run on the Tk thread."""
+    if isinstance(prepared, str):
+        return tk.PhotoImage(master=master, file=prepared)
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(prepared, master=master)
+
+def load_background(master, path: str = BG_IMAGE_PATH, size=WINDOW_SIZE, cache_dir: str = BG_CACHE_DIR):
+    """PhotoImage of `path` scaled to `size`; decodes and resizes only when the disk cache misses."""
+    return background_photo(master, prepare_background(path, size, cache_dir))
 
 # -----------------------------
-# Full schedule data (13 frames)
-# Each frame is a list of periods; each period is dict with start,end,activities (7 items Mon-Sun)
+# Ambient mode
 # -----------------------------
+AMBIENT_BG = "#000000"
+
+def parse_window(text: str):
+    """'HH:MM-HH:MM' -> (start_min, end_min); a window may run past midnight (23:00-06:00)."""
+    start, sep, end = text.partition("-")
+    if not sep:
+        raise ValueError(f"expected HH:MM-HH:MM, got {text!r}")
+    return hm_to_minutes(start), hm_to_minutes(end)
 
-FRAMES = {
-    "🎨 Base + Painting Frame": [
-        {"start":"07:00","end":"07:30","activities":["Personal Devotion (30m)","Devotion","Devotion","Devotion","Devotion","Devotion","Rest / Reflection"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics (30m)","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretching","Reflection"]},
-        {"start":"08:00","end":"08:30","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"08:30","end":"11:00","activities":["Painting Session I (2.5h)","—","Color blending & composition","Painting","Painting","Painting","Light Painting (1.5h)"]},
-        {"start":"11:00","end":"12:00","activities":["Cleaning / Laundry","Cleaning","Cleaning","Cleaning","Cleaning","General Cleaning","Planning next week"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:30","activities":["Painting Session II (2.5h)","—","Lighting & texture","Painting","Painting","Painting","Baking / Relax"]},
-        {"start":"15:30","end":"16:00","activities":["Break","Break","Break","Break","Break","—","—"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Help Brother","Learning Something New","Help Brother","Learning","Family Time","—"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"20:00","activities":["Reflection / Rest","Reflection","Video Ref / Inspiration","Reflection","Painting Review","Reflection","Rest"]},
-    ],
-
-    "✏️ Base + Drawing Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
-        {"start":"08:00","end":"09:30","activities":["Drawing Session I","—","Gesture & Anatomy","Drawing","Drawing","Drawing","Light Sketching"]},
-        {"start":"09:30","end":"10:30","activities":["Laundry / Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
-        {"start":"10:30","end":"12:00","activities":["Learning / Art Study","Reference Study","Perspective","Form","Shading Study","Baking","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Drawing Session II","—","Props & Armor","Drawing","Drawing","Drawing","Lore Sketch"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Help Brother","—","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Evening Drawing (1h)","—","Stylized form","Quick Studies","Quick Studies","Quick Studies","Review"]},
-    ],
-
-    "🧾 Base + Poster Design Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"12:00","activities":["Poster Design (Main Block)","—","Layout & typography","Poster","Poster","Poster","Poster (Light)"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"14:30","activities":["Learning","—","Composition theory","Canva Practice","Icon Hierarchy","Font Study","Baking"]},
-        {"start":"14:30","end":"16:30","activities":["Cleaning / Laundry","Help Brother","Cleaning","Help Brother","Cleaning","Family Time","Planning"]},
-        {"start":"17:00","end":"18:00","activities":["Evening Poster Edit (1h)","Adjustments","Polish","Color tweak","Finalize","Upload","Rest"]},
-    ],
-
-    "🌀 Base + Logo Design Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:30","activities":["Logo Design Block I","—","Concept sketching","Logo","Logo","Logo","Logo (Short)"]},
-        {"start":"09:30","end":"11:00","activities":["Learning / Vector practice","Learning","Icon Study","Brand Form","Grid System","Baking","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Logo Design Block II","—","Vector creation","Logo","Logo","Logo","Polish"]},
-        {"start":"16:00","end":"17:00","activities":["Cleaning / Help Brother","Cleaning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Upload","Reflection","Upload","Inspiration","Archive","Rest","Rest"]},
-    ],
-
-    "📜 Base + Lore Writing Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"10:00","activities":["Writing Session I","—","Story structure","Writing","Writing","Writing","Light Writing"]},
-        {"start":"10:00","end":"11:00","activities":["Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
-        {"start":"11:00","end":"12:00","activities":["Learning: Narrative theory","Myth Study","Character Arcs","Tone Work","Scene Flow","Baking","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Writing Session II","—","Character development","Writing","Writing","Writing","Polish"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Help Brother","Learning","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reading","Reflection","Proofing","Rest","Rest"]},
-    ],
-
-    "🎞️ Base + Video Editing Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:30","activities":["Cooking / Cleaning","Cooking","Cooking","Cooking","Cooking","Cleaning","—"]},
-        {"start":"09:30","end":"11:30","activities":["Editing Block I","—","Clip sorting / cuts","Editing","Editing","Editing","Light Edit"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Learning","—","Color grading, audio","Learning","Study","Practice","Baking"]},
-        {"start":"17:00","end":"18:00","activities":["Editing Block II","—","Reels / Sound Sync","Upload","Polish","Export","Publish"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection","Reflection","Reflection","Reflection","Reflection","Rest","Rest"]},
-    ],
-
-    "📊 Base + Excel Automation Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:30","activities":["Excel Automation I","—","Formula & Logic","Excel","Excel","Excel","Light Excel"]},
-        {"start":"09:30","end":"11:00","activities":["Learning / Macro Study","Learning","VBA Practice","Dashboards","Testing","Baking","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Excel Automation II","—","File testing","Excel","Excel","Excel","Debug"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Cleaning","Learning","Help Brother","Cleaning","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
-    ],
-
-    "🧠 Base + Front-End Development Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Reflection / Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Rest"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"11:00","activities":["Front-End Dev I","—","HTML/CSS structure","Coding","UI Setup","Layout Design","Component Study"]},
-        {"start":"11:00","end":"12:00","activities":["Cleaning / Laundry","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Front-End Dev II","—","React / UX polish","Practice","Data Binding","Responsive Design","Debug"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Review / Project Journal","Reflection","Reading","Reflection","Review","Rest","Rest"]},
-    ],
-
-    "🐍 Base + Database Integration Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"13:00","activities":["DB Integration Deep Block (4h)","—","SQL + Python connectors","Coding","Testing","CRUD Building","Query Writing"]},
-        {"start":"13:00","end":"14:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"14:00","end":"15:30","activities":["Learning","—","Schema design","Data flow","Learning","Reading","Practice"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Cleaning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Code Notes","Reflection","Reflection","Reflection","Reflection","Rest","Rest"]},
-    ],
-
-    "⚙️ Base + File Automation Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"11:00","activities":["Automation Block I","—","Python scripting","Coding","Coding","Coding","Testing"]},
-        {"start":"11:00","end":"12:00","activities":["Cleaning / Organizing","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Automation Block II","—","File management logic","File Ops","Export","Script Format","Tool Debug"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
-    ],
-
-    "🎥 Base + YouTube & Facebook Channel Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"11:00","activities":["Planning / Scripting Videos","Planning","Scripting","Voice Notes","Storyboard","Planning","—"]},
-        {"start":"11:00","end":"12:00","activities":["Cleaning / Setup","Cleaning","Setup","Cleaning","Setup","Cleaning","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Editing / Filming","—","Long edit session","Edit","Film","Edit","—"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:30","activities":["Upload & Analytics Review","Upload","Community","Upload","Comments","Review","Rest"]},
-    ],
-
-    "📱 Base + TikTok / Instagram Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"10:30","activities":["Content Ideation / Trends","Ideas","Concepts","Trends","Hooks","Planning","—"]},
-        {"start":"10:30","end":"12:00","activities":["Cleaning / Filming Setup","Cleaning","Setup","Cleaning","Setup","Cleaning","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"15:00","activities":["Filming + Editing","Reels","Film","Edit","Film","Edit","Film"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Post & Engage","—","Upload / Comments","Post","Engage","Post","Review"]},
-    ],
-
-    "💸 Base + Digital Product Sales Frame": [
-        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Reflection"]},
-        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Rest"]},
-        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"09:00","end":"10:30","activities":["Product Creation / Design","Product Design","Product Design","Product","—","—","—"]},
-        {"start":"10:30","end":"11:30","activities":["Cleaning / Upload Prep","Cleaning","Prep","Cleaning","Prep","Cleaning","—"]},
-        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"13:00","end":"14:30","activities":["Listing / Marketing","Copy Upload","SEO","Pricing","Thumbnails","Ads","—"]},
-        {"start":"14:30","end":"16:00","activities":["Shop Maintenance / Analytics","Review","Updates","Review","Updates","Review","—"]},
-        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
-        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
-        {"start":"18:00","end":"19:00","activities":["Reflection / Sales Notes","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
-    ],
-
-}
-
-# convert periods to numeric minute ranges and sort
-for frame_name, periods in FRAMES.items():
-    new_periods = []
-    for p in periods:
-        start_min = hm_to_minutes(p["start"])
-        end_min = hm_to_minutes(p["end"])
-        # guard: if end <= start (overnight), treat end as next day (not expected here)
-        if end_min <= start_min:
-            end_min += 24*60
-        new_periods.append({
-            "start_min": start_min,
-            "end_min": end_min,
-            "start": p["start"],
-            "end": p["end"],
-            "activities": p["activities"]
-        })
-    # sort by start_min
-    new_periods.sort(key=lambda x: x["start_min"])
-    FRAMES[frame_name] = new_periods
+def in_window(now_min: int, window) -> bool:
+    start_min, end_min = window
+    if start_min <= end_min:
+        return in_interval(now_min, start_min, end_min)
+    return now_min >= start_min or now_min < end_min
 
 # -----------------------------
 # GUI
 # -----------------------------
-class CreativeWatch:
-    def __init__(self, root):
+def recompute_time(index, now):
+    """First moment after `now` at which `index`'s prev/current/next can change: the next
+    period boundary, or midnight if that comes sooner."""
+    boundary = index.next_boundary(now.hour * 60 + now.minute, now.weekday())
+    if boundary is None or boundary > 24*60:
+        boundary = 24*60
+    return now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(minutes=boundary)
+
+class WatchLoops:
+    """Render counters, schedule hot reload and metrics, shared by CreativeWatch and Dashboard.
+    Subclasses set self.root, call _init_loops() before their first tick and _start_loops()
+    after it, and implement apply_reload(changed)."""
+
+    def _init_loops(self, render_stats_every=None, reload_every=None, metrics=False, metrics_file=None,
+                    metrics_every=15):
+        self.render = RenderCache()
+        self.render_stats_every = render_stats_every
+        self.reload_every = reload_every  # seconds between schedule file checks (None: off)
+        # metrics: a slotwatch_metrics.Metrics while instrumentation is on, else None
+        self.metrics = Metrics() if metrics else None
+        self.metrics_file = metrics_file
+        self.metrics_every = metrics_every
+        if self.metrics is not None:
+            self._init_metrics()
+
+    def _start_loops(self):
+        if self.render_stats_every:
+            self._render_stats_mark = (datetime.now(), self.render.applied)
+            self.root.after(int(self.render_stats_every * 1000), self.log_render_stats)
+        if self.reload_every:
+            self.root.after(int(self.reload_every * 1000), self.poll_schedules)
+
+    def log_render_stats(self):
+        # steady state should be ~1 applied config/s (the clock); more means needless redraws
+        now = datetime.now()
+        since, applied_then = self._render_stats_mark
+        elapsed = max((now - since).total_seconds(), 1e-6)
+        rate = (self.render.applied - applied_then) / elapsed
+        print(f"[render] applied={self.render.applied} skipped={self.render.skipped} "
+              f"rate={rate:.2f} updates/s over {elapsed:.0f}s", flush=True)
+        self._render_stats_mark = (now, self.render.applied)
+        self.root.after(int(self.render_stats_every * 1000), self.log_render_stats)
+
+    # --- instrumentation ---
+    def _init_metrics(self):
+        self._metrics_mark = self.render.applied
+        self._metrics_exported = 0
+        self.metrics_overlay = tk.Label(self.root, text="", bg="#000000", fg="#00FF88", font=("Consolas", 9),
+                                        justify="left", anchor="w", padx=6, pady=4)
+        self.metrics_overlay_shown = False
+        self.root.bind("<F9>", self.toggle_metrics_overlay)
+        if self.metrics_file:
+            self.root.after(int(self.metrics_every * 1000), self.export_metrics)
+
+    def _record_tick(self, started):
+        # redraws counted up to here; the overlay's own repaint lands in the next sample
+        self.metrics.record(started, self.render.applied - self._metrics_mark)
+        if self.metrics_overlay_shown:
+            self.render.config(self.metrics_overlay, text=self.metrics.overlay_text())
+        self._metrics_mark = self.render.applied
+
+    def toggle_metrics_overlay(self, event=None):
+        self.metrics_overlay_shown = not self.metrics_overlay_shown
+        if self.metrics_overlay_shown:
+            self.render.config(self.metrics_overlay, text=self.metrics.overlay_text())
+            self.metrics_overlay.place(relx=0, rely=1, x=8, y=-8, anchor="sw")
+            self.metrics_overlay.lift()
+        else:
+            self.metrics_overlay.place_forget()
+
+    def export_metrics(self):
+        # summarise the ticks since the previous export
+        self.metrics.export(self.metrics_file, last=max(1, self.metrics.ticks - self._metrics_exported))
+        self._metrics_exported = self.metrics.ticks
+        self.root.after(int(self.metrics_every * 1000), self.export_metrics)
+
+    # --- hot reload ---
+    def poll_schedules(self):
+        # a stat() per schedule file when nothing changed; parsing only for edited files
+        t0 = perf_counter()
+        changed, reread = reload_frames()
+        if changed or reread:
+            self.apply_reload(changed)
+            cost = perf_counter() - t0
+            # latency: from the newest save to the swap being on screen
+            latency = f", {(time_ns() - max(m for _, m in reread)) / 1e9:.1f}s after save" if reread else ""
+            print(f"[reload] {len(reread)} file(s) re-read, {len(changed)} frame(s) changed in "
+                  f"{cost * 1000:.1f} ms{latency}: {', '.join(sorted(changed)) or '-'}", flush=True)
+        self.root.after(int(self.reload_every * 1000), self.poll_schedules)
+
+    def apply_reload(self, changed):
+        raise NotImplementedError
+
+class CreativeWatch(WatchLoops):
+    def __init__(self, root, event_driven=True, render_stats_every=None, staged_startup=True, startup_timing=False,
+                 reload_every=None, metrics=False, metrics_file=None, metrics_every=15,
+                 alert_leads=(), alert_bell=False, timeline_days=2, ambient_free=False, ambient_hours=()):
         self.root = root
+        # ambient mode: minute ticks and no background image during free time (ambient_free)
+        # and inside the (start_min, end_min) windows of ambient_hours
+        self.ambient_free = ambient_free
+        self.ambient_hours = tuple(ambient_hours)
+        self.ambient = False
+        self._clock_format = "%H:%M:%S"
+        # alert_leads: minutes before a period starts at which to flash (and maybe bell); () is off
+        self.alert_leads = tuple(alert_leads)
+        self.alert_bell = alert_bell
+        self.timeline_days = timeline_days
+        self.timeline = None
+        self._timeline_after = None
+        self._flash_after = None
+        # staged_startup: paint clock and activity first, decode the background on a worker thread
+        self.staged_startup = staged_startup
+        self.startup_timing = startup_timing
+        self.startup_times = {}  # "first_paint" / "fully_loaded", seconds since STARTUP_T0
+        # event_driven: repaint only the clock each second and recompute activities at
+        # period boundaries; False restores the old full update_display on every tick
+        self.event_driven = event_driven
+        self._computed_at = None
+        self._recompute_at = None
+        self._tick_after = None  # the pending tick's after() id; None while a tick runs
 
         root.title("Personal Routine Watch")
-        root.geometry("1200x850")
+        root.geometry(f"{WINDOW_SIZE[0]}x{WINDOW_SIZE[1]}")
         root.configure(bg="#050505")
         root.resizable(False, False)
 
         # === Background Image ===
-        self.bg_image = Image.open("PURPLE3.JPG")
-        self.bg_image = self.bg_image.resize((self.root.winfo_screenwidth(), self.root.winfo_screenheight()),
-                                             Image.LANCZOS)
-        self.bg_photo = ImageTk.PhotoImage(self.bg_image)
-
-        self.bg_label = tk.Label(self.root, image=self.bg_photo)
+        # the label is created first so it stays beneath everything; its image may arrive later
+        self.bg_photo = None
+        self.bg_label = tk.Label(self.root, bg="#050505")
         self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 
         # Style constants
@@ -270,6 +490,7 @@ class CreativeWatch:
         # default select first
         self.frame_var.set(values[0])
         self.selected_schedule = FRAMES[self.frame_var.get()]
+        self.selected_index = FRAME_INDEX[self.frame_var.get()]
 
         # big card area
         card = tk.Frame(root, bg=self.card, bd=0, relief="ridge")
@@ -294,6 +515,9 @@ class CreativeWatch:
         self.current_title.pack(anchor="w")
         self.current_label = tk.Label(self.current_frame, text="", bg="#07110e", fg="#eafaf1", font=("Segoe UI", 25), wraplength=560, justify="center")
         self.current_label.pack(pady=(6,6))
+        # label texts per (frame, weekday, period), current text pre-wrapped to the label's width
+        self.label_texts = LabelTextCache(TextWrapper(tkfont.Font(root=root, font=("Segoe UI", 25)), 560))
+        self._warm_generation = 0
 
         # Next activity
         self.next_label = tk.Label(card, text="", bg=self.card, fg=self.teal, font=("Segoe UI", 12))
@@ -309,114 +533,307 @@ class CreativeWatch:
 
         # schedule popup reference
         self.schedule_win = None
+        self.schedule_header = None
+        self.schedule_list = None
 
-        # start updates
-        self.update_display()
-        # tick every second for clock
+        self._init_loops(render_stats_every, reload_every, metrics, metrics_file, metrics_every)
+
+        # start updates; tick paints immediately and then every wall-clock second
         self.tick()
+        self.rebuild_timeline()
+        self.warm_label_texts()
+        self.time_label.bind("<Expose>", self._on_first_expose)
+        if self.ambient:
+            self._mark_startup("fully_loaded")  # started in ambient: the image loads when it ends
+        else:
+            self.start_background()
+        self._start_loops()
+
+    # --- staged startup ---
+    def start_background(self):
+        if self.staged_startup:
+            self._bg_queue = queue.SimpleQueue()
+            threading.Thread(target=self._prepare_background_worker, daemon=True).start()
+            self.root.after(30, self._poll_background)
+        else:
+            self.set_background(load_background(self.root))
+
+    def _prepare_background_worker(self):
+        # worker thread: no Tk calls here, the result goes back through the queue
+        try:
+            self._bg_queue.put(prepare_background())
+        except Exception as exc:
+            self._bg_queue.put(exc)
+
+    def _poll_background(self):
+        try:
+            prepared = self._bg_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(30, self._poll_background)
+            return
+        if isinstance(prepared, Exception):
+            print(f"background image unavailable: {prepared}", file=sys.stderr)
+            self._mark_startup("fully_loaded")
+        else:
+            self.set_background(background_photo(self.root, prepared))
+
+    def set_background(self, photo):
+        if not self.ambient:  # (went ambient while it loaded: drop it again)
+            self.bg_photo = photo
+            self.bg_label.config(image=photo)
+        self._mark_startup("fully_loaded")
+
+    def _on_first_expose(self, event=None):
+        self.time_label.unbind("<Expose>")
+        # the Expose arrives before Tk's idle redraw; flush it so the mark is the real paint
+        self.root.update_idletasks()
+        self._mark_startup("first_paint")
+
+    def _mark_startup(self, stage):
+        if stage in self.startup_times:
+            return
+        self.startup_times[stage] = perf_counter() - STARTUP_T0
+        if self.startup_timing and "first_paint" in self.startup_times and "fully_loaded" in self.startup_times:
+            print(f"[startup] first paint {self.startup_times['first_paint']:.3f}s, "
+                  f"fully loaded {self.startup_times['fully_loaded']:.3f}s", flush=True)
 
     def on_select(self, event=None):
-        self.selected_schedule = FRAMES.get(self.frame_var.get(), [])
+        self.selected_schedule = FRAMES.get(self.frame_var.get()) or Frame()
+        self.selected_index = FRAME_INDEX.get(self.frame_var.get()) or FrameIndex(self.selected_schedule)
         self.update_display()
+        self.rebuild_timeline()
+        self.warm_label_texts()
+
+    def warm_label_texts(self):
+        """Fill the label text cache at idle time: the selected frame's whole week, then what
+        each other frame whose index is already built would show right now, so switching back
+        to it paints from the cache. Frames that were never indexed stay that way."""
+        self._warm_generation += 1
+        built = FRAME_INDEX.built()
+        # one text per boundary of the selected frame and one per other frame: none may evict another
+        self.label_texts.reserve(len(self.selected_index.boundaries) + len(built))
+        self.root.after_idle(self._warm_step, self._warm_generation, self._warm_jobs(datetime.now(), built.values()))
+
+    def _warm_jobs(self, now, others):
+        index = self.selected_index
+        # each boundary starts a new (prev, current, next) state; together they are the whole week
+        for boundary in index.boundaries:
+            boundary %= WEEK_MINUTES
+            yield index, boundary % DAY_MINUTES, boundary // DAY_MINUTES
+        for other in others:
+            if other is not index:
+                yield other, now.hour * 60 + now.minute, now.weekday()
+
+    def _warm_step(self, generation, jobs):
+        if generation != self._warm_generation:
+            return  # superseded by a later frame switch
+        deadline = perf_counter() + 0.004
+        for index, now_min, weekday_index in jobs:
+            self.label_texts.texts(index, now_min, weekday_index)
+            if perf_counter() > deadline:
+                # yield to pending events; carry on at the next idle moment
+                self.root.after_idle(self._warm_step, generation, jobs)
+                return
 
     def find_prev_curr_next(self, now_minute: int, weekday_index: int):
         """Return (prev_entry, curr_entry, next_entry) where each is a tuple (start, end, activity) or None.
            Activity chosen is schedule.activities[weekday_index].
         """
-        periods = self.selected_schedule
-        prev_e = None
-        curr_e = None
-        next_e = None
-
-        # flatten periods so that we can inspect them in order
-        for i, p in enumerate(periods):
-            # for activities that may have shorter activity arrays, guard indexing
-            activities = p["activities"]
-            activity = activities[weekday_index] if weekday_index < len(activities) else activities[0]
-            s = p["start_min"]
-            e = p["end_min"]
-            if in_interval(now_minute, s, e):
-                curr_e = (p["start"], p["end"], activity)
-                # previous is previous period if exists
-                if i - 1 >= 0:
-                    prev_p = periods[i-1]
-                    prev_activity = prev_p["activities"][weekday_index] if weekday_index < len(prev_p["activities"]) else prev_p["activities"][0]
-                    prev_e = (prev_p["start"], prev_p["end"], prev_activity)
-                # next is next period if exists
-                if i + 1 < len(periods):
-                    next_p = periods[i+1]
-                    next_activity = next_p["activities"][weekday_index] if weekday_index < len(next_p["activities"]) else next_p["activities"][0]
-                    next_e = (next_p["start"], next_p["end"], next_activity)
-                break
-            elif now_minute < s:
-                # current time is before this period; then next is this period, previous is previous
-                next_e = (p["start"], p["end"], activity)
-                if i - 1 >= 0:
-                    prev_p = periods[i-1]
-                    prev_activity = prev_p["activities"][weekday_index] if weekday_index < len(prev_p["activities"]) else prev_p["activities"][0]
-                    prev_e = (prev_p["start"], prev_p["end"], prev_activity)
-                else:
-                    prev_e = None
-                break
-            else:
-                # after this period, continue — prev might be updated
-                prev_activity = activity
-                prev_e = (p["start"], p["end"], prev_activity)
-                # continue loop to find either curr or next
-
-        # if we didn't match any and now is after all periods, prev is last, next None
-        if curr_e is None and next_e is None:
-            if periods:
-                last = periods[-1]
-                activities = last["activities"]
-                activity = activities[weekday_index] if weekday_index < len(activities) else activities[0]
-                if now_minute >= last["end_min"]:
-                    prev_e = (last["start"], last["end"], activity)
-                    next_e = None
-        return prev_e, curr_e, next_e
-
-    def update_display(self):
-        now = datetime.now()
+        return self.selected_index.lookup(now_minute, weekday_index)
+
+    def update_display(self, now=None):
+        metrics = self.metrics
+        if metrics is not None:
+            started = perf_counter()
+        if now is None:
+            now = datetime.now()
         day_name = now.strftime("%A")
         weekday_index = now.weekday()  # Mon=0
         now_min = now.hour * 60 + now.minute
 
         # update time and day
-        self.day_label.config(text=f"📅 {day_name}")
-        self.time_label.config(text=now.strftime("%H:%M:%S"))
+        self.render.config(self.day_label, text=f"📅 {day_name}")
+        self.render.config(self.time_label, text=now.strftime(self._clock_format))
 
-        # compute previous/current/next
-        prev_e, curr_e, next_e = self.find_prev_curr_next(now_min, weekday_index)
+        # compute previous/current/next, as ready-made label texts
+        if metrics is not None:
+            lookup_started = perf_counter()
+        prev_text, current_text, next_text, in_period = self.label_texts.texts(self.selected_index, now_min,
+                                                                               weekday_index)
+        if metrics is not None:
+            metrics.lookup_s = perf_counter() - lookup_started
 
-        if prev_e:
-            pst, pet, pact = prev_e
-            self.prev_label.config(text=f"⤴ Previous: {pact}  ({pst}–{pet})")
-        else:
-            self.prev_label.config(text="⤴ Previous: —")
+        # nothing below can change before the next period boundary (or midnight rollover)
+        self._computed_at = now
+        self._recompute_at = recompute_time(self.selected_index, now)
+        if self.ambient_free or self.ambient_hours:
+            self.set_ambient(self._ambient_due(now_min, in_period), now)
+            edge = self._next_ambient_edge(now)
+            if edge is not None and edge < self._recompute_at:
+                self._recompute_at = edge
 
-        if curr_e:
-            cst, cet, cact = curr_e
-            self.current_label.config(text=f"{cact}\n\n({cst}–{cet})")
-            self.current_frame.config(bg="#072a1f")
-            self.current_title.config(bg="#072a1f")
-            self.current_label.config(bg="#072a1f")
+        self.render.config(self.prev_label, text=prev_text)
+
+        if in_period:
+            self.render.config(self.current_frame, bg="#072a1f")
+            self.render.config(self.current_title, bg="#072a1f")
+            self.render.config(self.current_label, text=current_text, bg="#072a1f")
         else:
             # when no current period, show free time
-            self.current_label.config(text="Free / Unscheduled Time")
-            self.current_frame.config(bg="#07110e")
-            self.current_title.config(bg="#07110e")
-            self.current_label.config(bg="#07110e")
+            self.render.config(self.current_frame, bg="#07110e")
+            self.render.config(self.current_title, bg="#07110e")
+            self.render.config(self.current_label, text=current_text, bg="#07110e")
 
-        if next_e:
-            nst, net, nact = next_e
-            self.next_label.config(text=f"⤵ Next: {nact}  ({nst}–{net})")
-        else:
-            self.next_label.config(text="⤵ Next: —")
+        self.render.config(self.next_label, text=next_text)
+
+        # keep an open schedule popup in step (frame switch, new period, new day)
+        if self.schedule_list is not None:
+            self.refresh_full_schedule(now)
+        if metrics is not None:
+            metrics.update_s = perf_counter() - started
 
     def tick(self):
-        # update every second: time and possibly activities
-        self.update_display()
-        self.root.after(1000, self.tick)
+        # update every second: time, and activities only once a boundary has been reached
+        self._tick_after = None
+        if self.metrics is not None:
+            started = perf_counter()
+        now = datetime.now()
+        if not self.event_driven:
+            self.update_display(now)
+        elif self._recompute_at is None or now >= self._recompute_at or now < self._computed_at:
+            # (now < _computed_at: wall clock was set back, boundary is stale)
+            if self.timeline is not None and now < self._computed_at:
+                self.rebuild_timeline(now)
+            self.update_display(now)
+        else:
+            self.render.config(self.time_label, text=now.strftime(self._clock_format))
+        # re-arm on the next wall-clock second instead of a flat 1000 ms, so the
+        # accumulated after() latency never drifts the clock behind real time
+        if self.ambient:
+            # minute clock: wake on the next minute boundary only
+            delay = 60000 - now.second * 1000 - now.microsecond // 1000
+            self._ambient_wakeups += 1
+            if perf_counter() - self._ambient_reported >= 3600:
+                self.report_ambient("still on")
+        else:
+            delay = 1000 - now.microsecond // 1000
+        if self.metrics is not None:
+            self._record_tick(started)
+            self.metrics.arm(delay)
+        self._tick_after = self.root.after(delay, self.tick)
+
+    # --- ambient mode ---
+    def _ambient_due(self, now_min, in_period):
+        if self.ambient_free and not in_period:
+            return True
+        return any(in_window(now_min, window) for window in self.ambient_hours)
+
+    def _next_ambient_edge(self, now):
+        """Next start or end of an ambient_hours window after `now`, or None."""
+        if not self.ambient_hours:
+            return None
+        now_min = now.hour * 60 + now.minute
+        ahead = min((edge - now_min - 1) % (24*60) + 1 for window in self.ambient_hours for edge in window)
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=ahead)
+
+    def set_ambient(self, on, now):
+        if on == self.ambient:
+            return
+        if on:
+            self.ambient = True
+            self._clock_format = "%H:%M"
+            self._ambient_started = self._ambient_reported = perf_counter()
+            self._ambient_wakeups = 0
+            # the label lets go of the image first, so dropping our reference frees its pixels
+            self.bg_label.config(image="", bg=AMBIENT_BG)
+            self.bg_photo = None
+            print(f"[ambient] on at {now:%H:%M}", flush=True)
+        else:
+            self.report_ambient(f"off at {now:%H:%M}")
+            self.ambient = False
+            self._clock_format = "%H:%M:%S"
+            self.bg_label.config(bg=self.bg)
+            self.start_background()
+            if self._tick_after is not None:
+                # left outside a tick (frame switch, Refresh Now, reload): the pending tick is
+                # the minute-aligned one, so bring the seconds clock back on the next second
+                self.root.after_cancel(self._tick_after)
+                delay = 1000 - datetime.now().microsecond // 1000
+                if self.metrics is not None:
+                    self.metrics.arm(delay)
+                self._tick_after = self.root.after(delay, self.tick)
+        self.render.config(self.time_label, text=now.strftime(self._clock_format))
+
+    def report_ambient(self, what):
+        elapsed = perf_counter() - self._ambient_started
+        print(f"[ambient] {what}: {self._ambient_wakeups} wakeups in {elapsed / 60:.0f} min "
+              f"({self._ambient_wakeups / max(elapsed / 3600, 1e-9):.1f}/h)", flush=True)
+        self._ambient_reported = perf_counter()
+
+    # --- transition alerts ---
+    def rebuild_timeline(self, now=None):
+        """Fresh timeline for the selected frame (startup, frame switch, clock set back)."""
+        if not self.alert_leads:
+            return
+        if now is None:
+            now = datetime.now()
+        self.timeline = TransitionTimeline(self.selected_index, now, self.timeline_days, self.alert_leads)
+        self._arm_timeline(now)
+
+    def _arm_timeline(self, now):
+        # one pending after() for the whole timeline: the next event, whatever its kind
+        if self._timeline_after is not None:
+            self.root.after_cancel(self._timeline_after)
+            self._timeline_after = None
+        when = self.timeline.next_time()
+        if when is not None:
+            delay = max(0, int((when - now).total_seconds() * 1000) + 1)
+            self._timeline_after = self.root.after(delay, self._on_timeline_event)
+
+    def _on_timeline_event(self):
+        self._timeline_after = None
+        now = datetime.now()
+        due = self.timeline.pop_due(now)
+        if any(kind != "alert" for _, kind, _, _ in due):
+            # a period started or ended: repaint right on the boundary
+            self.update_display(now)
+        # after a long stall, only alerts whose period hasn't started yet are still news
+        alerts = [(lead, entry) for when, kind, entry, lead in due
+                  if kind == "alert" and when + timedelta(minutes=lead) > now]
+        if alerts:
+            self.show_alert(*min(alerts, key=lambda alert: alert[0]))
+        self._arm_timeline(now)
+
+    def show_alert(self, lead, entry):
+        start, end, activity = entry
+        self.render.config(self.current_title, text=f"⏰ {activity} starts in {lead} min ({start})")
+        if self.alert_bell:
+            self.root.bell()
+        if self._flash_after is not None:
+            self.root.after_cancel(self._flash_after)
+        self._flash(12)
+
+    def _flash(self, remaining):
+        # blink an amber ring round the current-activity panel, then put the title back
+        if remaining:
+            self.render.config(self.current_frame, highlightthickness=4,
+                               highlightbackground="#ffb000" if remaining % 2 == 0 else self.card)
+            self._flash_after = self.root.after(400, self._flash, remaining - 1)
+        else:
+            self._flash_after = None
+            self.render.config(self.current_frame, highlightthickness=0)
+            self.render.config(self.current_title, text="Current")
+
+    def apply_reload(self, changed):
+        """Swap reloaded frames into the selector and, if the shown frame changed, the display."""
+        values = list(FRAMES.keys())
+        self.combo.config(values=values)
+        if self.frame_var.get() not in FRAMES:
+            self.frame_var.set(values[0])  # the shown frame's file was removed
+        elif self.frame_var.get() not in changed:
+            self.warm_label_texts()  # other frames' indexes were replaced
+            return
+        self.on_select()
 
     def show_full_schedule(self):
         # popup that lists today's periods for the selected frame
@@ -427,41 +844,227 @@ class CreativeWatch:
         self.schedule_win.title("Today's Schedule")
         self.schedule_win.geometry("520x520")
         self.schedule_win.configure(bg=self.bg)
+        self.schedule_win.protocol("WM_DELETE_WINDOW", self.close_full_schedule)
+
+        self.schedule_header = tk.Label(self.schedule_win, text="", bg=self.bg, fg=self.neon, font=("Segoe UI", 12, "bold"))
+        self.schedule_header.pack(pady=8)
+
+        body = tk.Frame(self.schedule_win, bg=self.bg)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        canvas = tk.Canvas(body, bg=self.card, highlightthickness=0)
+        scrollbar = tk.Scrollbar(body, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        canvas.pack(side="left", fill="both", expand=True)
+
+        self.schedule_list = ScheduleList(canvas, bg=self.card, time_fg=self.gray, activity_fg=self.teal,
+                                          highlight_bg="#072a1f")
+        scrollbar.config(command=self.schedule_list.yview)
+        canvas.config(yscrollcommand=scrollbar.set)
+        self.refresh_full_schedule()
+
+    def refresh_full_schedule(self, now=None):
+        """Point the open popup at the selected frame and today's weekday, highlighting the current period."""
+        if now is None:
+            now = datetime.now()
+        weekday_index = now.weekday()
+        self.render.config(self.schedule_header, text=f"{self.frame_var.get()} — {now.strftime('%A')}")
+        self.schedule_list.set_entries(self.selected_index.days[weekday_index],
+                                       self.selected_index.current_index(now.hour * 60 + now.minute, weekday_index))
+
+    def close_full_schedule(self):
+        self.render.forget(self.schedule_header)
+        self.schedule_win.destroy()
+        self.schedule_win = None
+        self.schedule_header = None
+        self.schedule_list = None
+
+# -----------------------------
+# Dashboard
+# Many frames side by side, driven by one tick for the whole grid: it reads the clock once,
+# repaints the shared clock, and pops only the cards whose next boundary has passed off a
+# heap, so the per-second cost grows with boundary events rather than with cards.
+# -----------------------------
+class FrameCard:
+    """One frame's tile on the dashboard: name, current activity and times, and what's next."""
+
+    def __init__(self, parent, frame_name, index, wraplength=260):
+        self.frame_name = frame_name
+        self.index = index
+        self.box = tk.Frame(parent, bg="#0b0b0b", padx=10, pady=8)
+        self.name_label = tk.Label(self.box, text=frame_name, bg="#0b0b0b", fg="#00FF88",
+                                   font=("Segoe UI", 11, "bold"), anchor="w")
+        self.name_label.pack(fill="x")
+        self.current_label = tk.Label(self.box, text="", bg="#07110e", fg="#eafaf1", font=("Segoe UI", 13),
+                                      wraplength=wraplength, justify="left", anchor="w", padx=6, pady=4)
+        self.current_label.pack(fill="x", pady=(4, 2))
+        self.next_label = tk.Label(self.box, text="", bg="#0b0b0b", fg="#2ad1bf", font=("Segoe UI", 10),
+                                   wraplength=wraplength, justify="left", anchor="w")
+        self.next_label.pack(fill="x")
+
+    def update(self, render, now_min, weekday_index):
+        prev_e, curr_e, next_e = self.index.lookup(now_min, weekday_index)
+        if curr_e:
+            cst, cet, cact = curr_e
+            render.config(self.current_label, text=f"{cact}\n({cst}–{cet})", bg="#072a1f")
+        else:
+            render.config(self.current_label, text="Free / Unscheduled Time", bg="#07110e")
+        if next_e:
+            nst, net, nact = next_e
+            render.config(self.next_label, text=f"⤵ {nact}  ({nst}–{net})")
+        else:
+            render.config(self.next_label, text="⤵ —")
+
+class Dashboard(WatchLoops):
+    # longest stretch of card repaints per event-loop turn (seconds); a boundary shared by
+    # many cards (midnight) is spread over several turns instead of stalling input and redraws
+    DRAIN_BUDGET = 0.008
+
+    def __init__(self, root, frame_names, columns=None, render_stats_every=None, reload_every=None,
+                 metrics=False, metrics_file=None, metrics_every=15):
+        self.root = root
+        self._now = None           # the tick's single datetime.now(), shared by every card
+        self._computed_at = None
+        self._due = []             # heap of (recompute_at, card position)
+        self._drain_pending = False
 
-        day_name = datetime.now().strftime("%A")
-        weekday_index = datetime.now().weekday()
+        root.title("Routine Dashboard")
+        root.configure(bg="#050505")
+
+        header = tk.Frame(root, bg="#050505")
+        header.pack(padx=14, pady=(12, 6), fill="x")
+        tk.Label(header, text="Routine Dashboard", bg="#050505", fg="#00FF88",
+                 font=("Segoe UI", 16, "bold")).pack(side="left")
+        self.time_label = tk.Label(header, text="", bg="#050505", fg="#00FF88", font=("Segoe UI", 28, "bold"))
+        self.time_label.pack(side="right")
+        self.day_label = tk.Label(header, text="", bg="#050505", fg="#bfc9c6", font=("Segoe UI", 18, "italic"))
+        self.day_label.pack(side="right", padx=(0, 16))
 
-        header = tk.Label(self.schedule_win, text=f"{self.frame_var.get()} — {day_name}", bg=self.bg, fg=self.neon, font=("Segoe UI", 12, "bold"))
-        header.pack(pady=8)
+        grid = tk.Frame(root, bg="#050505")
+        grid.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+        columns = columns or max(1, math.ceil(math.sqrt(len(frame_names))))
+        for c in range(columns):
+            grid.columnconfigure(c, weight=1, uniform="card")
+        self.cards = []
+        for pos, frame_name in enumerate(frame_names):
+            card = FrameCard(grid, frame_name, FRAME_INDEX.get(frame_name) or FrameIndex(Frame()),
+                             wraplength=max(120, 1100 // columns - 40))
+            card.box.grid(row=pos // columns, column=pos % columns, sticky="nsew", padx=4, pady=4)
+            self.cards.append(card)
+
+        self._init_loops(render_stats_every, reload_every, metrics, metrics_file, metrics_every)
+        self.tick()
+        self._start_loops()
 
-        canvas = tk.Canvas(self.schedule_win, bg=self.card, highlightthickness=0)
-        canvas.pack(fill="both", expand=True, padx=10, pady=10)
+    def tick(self):
+        if self.metrics is not None:
+            started = perf_counter()
+        now = self._now = datetime.now()
+        if self._computed_at is None or now < self._computed_at:
+            # first tick, or the wall clock was set back: every card's boundary is stale
+            self._due = [(now, pos) for pos in range(len(self.cards))]
+        self._computed_at = now
+        self.render.config(self.day_label, text=f"📅 {now.strftime('%A')}")
+        self.render.config(self.time_label, text=now.strftime("%H:%M:%S"))
+        if self._due and self._due[0][0] <= now and not self._drain_pending:
+            self._drain()
+        delay = 1000 - now.microsecond // 1000
+        if self.metrics is not None:
+            self._record_tick(started)
+            self.metrics.arm(delay)
+        self.root.after(delay, self.tick)
 
-        frame_inner = tk.Frame(canvas, bg=self.card)
-        canvas.create_window((0,0), window=frame_inner, anchor="nw")
+    def _drain(self):
+        """Repaint the cards whose boundary has passed, for at most DRAIN_BUDGET per call."""
+        self._drain_pending = False
+        now = self._now
+        now_min, weekday_index = now.hour * 60 + now.minute, now.weekday()
+        due = self._due
+        started = perf_counter()
+        deadline = started + self.DRAIN_BUDGET
+        while due and due[0][0] <= now:
+            pos = heapq.heappop(due)[1]
+            card = self.cards[pos]
+            card.update(self.render, now_min, weekday_index)
+            heapq.heappush(due, (recompute_time(card.index, now), pos))
+            if perf_counter() > deadline:
+                # let Tk handle input and redraw, then carry on with the same clock reading
+                self._drain_pending = True
+                self.root.after(1, self._drain)
+                break
+        if self.metrics is not None:
+            # the dashboard's update_display: card repaints (summed over slices)
+            self.metrics.update_s = (self.metrics.update_s or 0.0) + perf_counter() - started
 
-        # populate
-        for p in self.selected_schedule:
-            s = p["start"]
-            e = p["end"]
-            activities = p["activities"]
-            act = activities[weekday_index] if weekday_index < len(activities) else activities[0]
-            row = tk.Frame(frame_inner, bg=self.card, pady=6, padx=8)
-            row.pack(fill="x", padx=6, pady=4)
-            tlabel = tk.Label(row, text=f"{s}–{e}", bg=self.card, fg=self.gray, width=12, anchor="w", font=("Segoe UI", 10))
-            tlabel.pack(side="left")
-            alabel = tk.Label(row, text=act, bg=self.card, fg=self.teal, anchor="w", font=("Segoe UI", 11), wraplength=360, justify="left")
-            alabel.pack(side="left", padx=(8,0))
+    def apply_reload(self, changed):
+        """Point the cards of changed frames at their new index and repaint them now."""
+        positions = {pos for pos, card in enumerate(self.cards) if card.frame_name in changed}
+        if not positions:
+            return
+        # one heap entry per card: drop the changed cards' old boundaries before re-queueing them
+        self._due = [item for item in self._due if item[1] not in positions]
+        heapq.heapify(self._due)
+        for pos in positions:
+            card = self.cards[pos]
+            card.index = FRAME_INDEX.get(card.frame_name) or FrameIndex(Frame())
+            heapq.heappush(self._due, (self._now, pos))
+        if not self._drain_pending:
+            self._drain()
 
-        # scrolling
-        def on_config(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        frame_inner.bind("<Configure>", on_config)
 
 # -----------------------------
 # Run
 # -----------------------------
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = CreativeWatch(root)
+    parser = argparse.ArgumentParser(description="Personal Routine Watch")
+    parser.add_argument("--every-second", action="store_true",
+                        help="recompute activities on every tick instead of only at period boundaries")
+    parser.add_argument("--render-stats", type=float, metavar="SECONDS",
+                        help="print applied/skipped widget update counters every SECONDS")
+    parser.add_argument("--blocking-startup", action="store_true",
+                        help="load the background before the first paint instead of on a worker thread")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="print time to first paint and time to fully loaded")
+    parser.add_argument("--reload", type=float, metavar="SECONDS",
+                        help="check the schedule files every SECONDS and apply edits without a restart")
+    parser.add_argument("--metrics", action="store_true",
+                        help="record tick lateness, update/lookup time, redraws and RSS (F9 toggles an overlay)")
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help="with --metrics: append JSON lines to PATH, or rewrite it as Prometheus text if it ends in .prom")
+    parser.add_argument("--metrics-every", type=float, default=15, metavar="SECONDS",
+                        help="metrics export interval (default 15)")
+    parser.add_argument("--alert", type=int, action="append", default=[], metavar="MINUTES",
+                        help="flash the current-activity panel MINUTES before each period starts (repeatable)")
+    parser.add_argument("--alert-bell", action="store_true", help="also ring the bell on --alert")
+    parser.add_argument("--alert-days", type=int, default=2, metavar="N",
+                        help="days of upcoming transitions to keep queued (default 2)")
+    parser.add_argument("--ambient", action="store_true",
+                        help="during free time show a minute clock on a plain background (no image in memory)")
+    parser.add_argument("--ambient-hours", action="append", default=[], metavar="HH:MM-HH:MM",
+                        help="also go ambient between these times (repeatable)")
+    parser.add_argument("--dashboard", nargs="*", metavar="FRAME",
+                        help="show these frames (names or unique fragments; default: all) side by side")
+    parser.add_argument("--columns", type=int, help="dashboard columns (default: about square)")
+    args = parser.parse_args()
+    try:
+        ambient_hours = [parse_window(w) for w in args.ambient_hours]
+    except ValueError as exc:
+        parser.error(f"--ambient-hours: {exc}")
+
+    if args.dashboard is not None:
+        try:
+            frame_names = [resolve_frame(f) for f in args.dashboard] or list(FRAMES)
+        except KeyError as exc:
+            parser.exit(2, f"slotwatch: {exc.args[0]}\n")
+        root = tk.Tk()
+        app = Dashboard(root, frame_names, columns=args.columns, render_stats_every=args.render_stats,
+                        reload_every=args.reload, metrics=args.metrics or bool(args.metrics_file),
+                        metrics_file=args.metrics_file, metrics_every=args.metrics_every)
+    else:
+        root = tk.Tk()
+        app = CreativeWatch(root, event_driven=not args.every_second, render_stats_every=args.render_stats,
+                            staged_startup=not args.blocking_startup, startup_timing=args.startup_timing,
+                            reload_every=args.reload, metrics=args.metrics or bool(args.metrics_file),
+                            metrics_file=args.metrics_file, metrics_every=args.metrics_every,
+                            alert_leads=args.alert, alert_bell=args.alert_bell, timeline_days=args.alert_days,
+                            ambient_free=args.ambient, ambient_hours=ambient_hours)
     root.mainloop()
@@ -0,0 +1,209 @@
+"""
+slotwatch_cli.py
+Command-line access to the schedule engine, without starting the GUI (no Tk / PIL imports).
+
+    python slotwatch_cli.py frames
+    python slotwatch_cli.py now --frame painting [--at "2025-10-27 09:15"] [--json]
+    python slotwatch_cli.py day --frame painting --weekday 3
+    python slotwatch_cli.py batch < queries.tsv
+    python slotwatch_cli.py report [--frame painting --frame drawing] [--compare 2]
+
+--frame takes a full frame name or any case-insensitive fragment that matches exactly one
+frame. batch reads "frame<TAB>timestamp" lines from stdin and writes one TSV (or --json)
+result line per query; timestamps are "YYYY-MM-DD HH:MM[:SS]" (or ISO with a T) in local
+wall-clock time, ISO with a UTC offset (converted to local time), or Unix epoch seconds.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from schedule_model import format_hm
+from slotwatch_engine import FRAME_INDEX, FRAMES, day_entries, resolve_frame
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# -----------------------------
+# Parsing / formatting
+# -----------------------------
+_WEEKDAY_BY_DATE = {}
+
+def parse_when(text: str):
+    """(minute of day, weekday) for a timestamp; see the module docstring for accepted forms.
+
+    Timestamps with a UTC offset are converted to local time; anything that isn't a whole
+    timestamp raises ValueError.
+    """
+    if (len(text) in (16, 19) and text[4] == "-" and text[10] in " T" and text[13] == ":"
+            and text[11:13].isdigit() and text[14:16].isdigit()
+            and (len(text) == 16 or (text[16] == ":" and text[17:19].isdigit() and text[17:19] < "60"))):
+        # fast path for the common form (no offset, nothing trailing); the weekday is cached per date
+        date = text[:10]
+        weekday = _WEEKDAY_BY_DATE.get(date)
+        if weekday is None:
+            weekday = _WEEKDAY_BY_DATE[date] = datetime.strptime(date, "%Y-%m-%d").weekday()
+        hh, mm = int(text[11:13]), int(text[14:16])
+        if hh > 23 or mm > 59:
+            raise ValueError(f"bad time in {text!r}")
+        return hh * 60 + mm, weekday
+    if text.replace(".", "", 1).isdigit():
+        t = time.localtime(float(text))
+        return t.tm_hour * 60 + t.tm_min, t.tm_wday
+    when = datetime.fromisoformat(text)
+    if when.tzinfo is not None:
+        when = when.astimezone().replace(tzinfo=None)
+    return when.hour * 60 + when.minute, when.weekday()
+
+def entry_dict(entry):
+    if entry is None:
+        return None
+    start, end, activity = entry
+    return {"start": start, "end": end, "activity": activity}
+
+def entry_line(label: str, entry) -> str:
+    if entry is None:
+        return f"{label:<5} —"
+    start, end, activity = entry
+    return f"{label:<5} {start}–{end}  {activity}"
+
+# -----------------------------
+# Commands
+# -----------------------------
+def cmd_frames(args):
+    for frame_name in FRAMES:
+        print(frame_name)
+
+def cmd_now(args):
+    frame_name = resolve_frame(args.frame) if args.frame else next(iter(FRAMES))
+    if args.at:
+        now_min, weekday = parse_when(args.at)
+    else:
+        now = datetime.now()
+        now_min, weekday = now.hour * 60 + now.minute, now.weekday()
+    prev_e, curr_e, next_e = FRAME_INDEX[frame_name].lookup(now_min, weekday)
+    if args.json:
+        print(json.dumps({"frame": frame_name, "weekday": weekday, "prev": entry_dict(prev_e),
+                          "current": entry_dict(curr_e), "next": entry_dict(next_e)}, ensure_ascii=False))
+        return
+    print(frame_name)
+    print(entry_line("prev", prev_e))
+    print(entry_line("now", curr_e) if curr_e else f"{'now':<5} Free / Unscheduled Time")
+    print(entry_line("next", next_e))
+
+def cmd_day(args):
+    frame_name = resolve_frame(args.frame) if args.frame else next(iter(FRAMES))
+    weekday = datetime.now().weekday() if args.weekday is None else args.weekday
+    entries = day_entries(frame_name, weekday)
+    if args.json:
+        print(json.dumps({"frame": frame_name, "weekday": weekday,
+                          "periods": [entry_dict(e) for e in entries]}, ensure_ascii=False))
+        return
+    print(f"{frame_name} — {DAY_NAMES[weekday]}")
+    for start, end, activity in entries:
+        print(f"{start}–{end}  {activity}")
+
+def cmd_batch(args):
+    indexes = {}  # frame argument as given -> FrameIndex
+    out = []
+    write = sys.stdout.write
+    errors = 0
+    for lineno, line in enumerate(sys.stdin, 1):
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        try:
+            frame_arg, stamp = line.split("\t", 1)
+            index = indexes.get(frame_arg)
+            if index is None:
+                index = indexes[frame_arg] = FRAME_INDEX[resolve_frame(frame_arg)]
+            now_min, weekday = parse_when(stamp)
+        except (ValueError, KeyError) as exc:
+            errors += 1
+            print(f"line {lineno}: {exc.args[0] if exc.args else exc}", file=sys.stderr)
+            continue
+        prev_e, curr_e, next_e = index.lookup(now_min, weekday)
+        if args.json:
+            out.append(json.dumps({"frame": frame_arg, "at": stamp, "prev": entry_dict(prev_e),
+                                   "current": entry_dict(curr_e), "next": entry_dict(next_e)},
+                                  ensure_ascii=False))
+        else:
+            # frame, timestamp, then start/end/activity for prev, current and next (empty if none)
+            out.append("\t".join((frame_arg, stamp, *(prev_e or ("", "", "")),
+                                  *(curr_e or ("", "", "")), *(next_e or ("", "", "")))))
+        if len(out) >= 4096:
+            out.append("")
+            write("\n".join(out))
+            out.clear()
+    if out:
+        out.append("")
+        write("\n".join(out))
+    return 1 if errors else 0
+
+def cmd_report(args):
+    # numpy (if present) is only imported for reports
+    from week_timeline import WeekTimeline
+
+    frame_names = [resolve_frame(f) for f in args.frame] if args.frame else list(FRAMES)
+    timeline = WeekTimeline(frame_names=frame_names)
+    if args.compare is not None:
+        print("\t".join(["time", *frame_names]))
+        for start, end, activities in timeline.compare(frame_names, args.compare):
+            print("\t".join([f"{format_hm(start)}–{format_hm(end)}", *(a or "—" for a in activities)]))
+        return
+    minutes = timeline.activity_minutes()
+    free = timeline.free_minutes_per_day()
+    for frame_name in frame_names:
+        print(frame_name)
+        for activity, total in sorted(minutes[frame_name].items(), key=lambda item: -item[1]):
+            print(f"  {total // 60:>4}h{total % 60:02d}  {activity}")
+        print("  free: " + "  ".join(f"{day[:3]} {m // 60}h{m % 60:02d}" for day, m in zip(DAY_NAMES, free[frame_name])))
+
+# -----------------------------
+# Run
+# -----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="slotwatch", description="Query routine frames without the GUI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("frames", help="list frame names").set_defaults(func=cmd_frames)
+
+    now_p = sub.add_parser("now", help="previous / current / next activity")
+    now_p.add_argument("--frame", help="frame name or unique fragment (default: first frame)")
+    now_p.add_argument("--at", help="timestamp to ask about instead of now")
+    now_p.add_argument("--json", action="store_true")
+    now_p.set_defaults(func=cmd_now)
+
+    day_p = sub.add_parser("day", help="all periods of one weekday")
+    day_p.add_argument("--frame", help="frame name or unique fragment (default: first frame)")
+    day_p.add_argument("--weekday", type=int, choices=range(7), metavar="0-6", help="Mon=0 (default: today)")
+    day_p.add_argument("--json", action="store_true")
+    day_p.set_defaults(func=cmd_day)
+
+    batch_p = sub.add_parser("batch", help="answer 'frame<TAB>timestamp' lines from stdin")
+    batch_p.add_argument("--json", action="store_true", help="JSON lines instead of TSV")
+    batch_p.set_defaults(func=cmd_batch)
+
+    report_p = sub.add_parser("report", help="weekly minutes per activity and free time, from the week timeline")
+    report_p.add_argument("--frame", action="append", help="frame to include (repeatable; default: all)")
+    report_p.add_argument("--compare", type=int, choices=range(7), metavar="0-6",
+                          help="instead, show the frames side by side for this weekday (Mon=0)")
+    report_p.set_defaults(func=cmd_report)
+
+    args = parser.parse_args(argv)
+    try:
+        status = args.func(args) or 0
+        sys.stdout.flush()  # a closed pipe shows up here rather than at interpreter exit
+        return status
+    except (KeyError, ValueError) as exc:
+        parser.exit(2, f"slotwatch: {exc.args[0] if exc.args else exc}\n")
+    except BrokenPipeError:
+        # the reader (head, a status bar) stopped early: not an error. Point stdout at devnull
+        # so the final flush at exit doesn't raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""
+slotwatch_engine.py
+GUI-free schedule engine: frame data, lookup index and prev/current/next queries.
+
+Imports neither tkinter nor PIL, so slotwatch_cli.py (and anything else that only needs
+"what's on now/next") starts fast. slotwatch2.py builds the GUI on top of this module.
+"""
+
+import heapq
+import os
+from array import array
+from bisect import bisect_right
+from collections import ChainMap
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from itertools import accumulate, count
+
+from schedule_model import format_end, format_hm, normalise_periods
+from schedule_store import ScheduleStore
+
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "slotwatch")
+# extra frames as JSON/TOML files (see schedule_store.py); same-named frames override the built-ins
+SCHEDULE_DIR = os.environ.get("SLOTWATCH_SCHEDULES") or os.path.join(MODULE_DIR, "schedules")
+
+# -----------------------------
+# Full schedule data (13 frames)
+# Each frame is a list of periods; each period is dict with start,end,activities (7 items Mon-Sun)
+# -----------------------------
+
+RAW_FRAMES = {
+    "🎨 Base + Painting Frame": [
+        {"start":"07:00","end":"07:30","activities":["Personal Devotion (30m)","Devotion","Devotion","Devotion","Devotion","Devotion","Rest / Reflection"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics (30m)","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretching","Reflection"]},
+        {"start":"08:00","end":"08:30","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"08:30","end":"11:00","activities":["Painting Session I (2.5h)","—","Color blending & composition","Painting","Painting","Painting","Light Painting (1.5h)"]},
+        {"start":"11:00","end":"12:00","activities":["Cleaning / Laundry","Cleaning","Cleaning","Cleaning","Cleaning","General Cleaning","Planning next week"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:30","activities":["Painting Session II (2.5h)","—","Lighting & texture","Painting","Painting","Painting","Baking / Relax"]},
+        {"start":"15:30","end":"16:00","activities":["Break","Break","Break","Break","Break","—","—"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Help Brother","Learning Something New","Help Brother","Learning","Family Time","—"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"20:00","activities":["Reflection / Rest","Reflection","Video Ref / Inspiration","Reflection","Painting Review","Reflection","Rest"]},
+    ],
+
+    "✏️ Base + Drawing Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
+        {"start":"08:00","end":"09:30","activities":["Drawing Session I","—","Gesture & Anatomy","Drawing","Drawing","Drawing","Light Sketching"]},
+        {"start":"09:30","end":"10:30","activities":["Laundry / Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
+        {"start":"10:30","end":"12:00","activities":["Learning / Art Study","Reference Study","Perspective","Form","Shading Study","Baking","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Drawing Session II","—","Props & Armor","Drawing","Drawing","Drawing","Lore Sketch"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Help Brother","—","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Evening Drawing (1h)","—","Stylized form","Quick Studies","Quick Studies","Quick Studies","Review"]},
+    ],
+
+    "🧾 Base + Poster Design Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"12:00","activities":["Poster Design (Main Block)","—","Layout & typography","Poster","Poster","Poster","Poster (Light)"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"14:30","activities":["Learning","—","Composition theory","Canva Practice","Icon Hierarchy","Font Study","Baking"]},
+        {"start":"14:30","end":"16:30","activities":["Cleaning / Laundry","Help Brother","Cleaning","Help Brother","Cleaning","Family Time","Planning"]},
+        {"start":"17:00","end":"18:00","activities":["Evening Poster Edit (1h)","Adjustments","Polish","Color tweak","Finalize","Upload","Rest"]},
+    ],
+
+    "🌀 Base + Logo Design Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:30","activities":["Logo Design Block I","—","Concept sketching","Logo","Logo","Logo","Logo (Short)"]},
+        {"start":"09:30","end":"11:00","activities":["Learning / Vector practice","Learning","Icon Study","Brand Form","Grid System","Baking","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Logo Design Block II","—","Vector creation","Logo","Logo","Logo","Polish"]},
+        {"start":"16:00","end":"17:00","activities":["Cleaning / Help Brother","Cleaning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Upload","Reflection","Upload","Inspiration","Archive","Rest","Rest"]},
+    ],
+
+    "📜 Base + Lore Writing Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"10:00","activities":["Writing Session I","—","Story structure","Writing","Writing","Writing","Light Writing"]},
+        {"start":"10:00","end":"11:00","activities":["Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
+        {"start":"11:00","end":"12:00","activities":["Learning: Narrative theory","Myth Study","Character Arcs","Tone Work","Scene Flow","Baking","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Writing Session II","—","Character development","Writing","Writing","Writing","Polish"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Help Brother","Learning","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reading","Reflection","Proofing","Rest","Rest"]},
+    ],
+
+    "🎞️ Base + Video Editing Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:30","activities":["Cooking / Cleaning","Cooking","Cooking","Cooking","Cooking","Cleaning","—"]},
+        {"start":"09:30","end":"11:30","activities":["Editing Block I","—","Clip sorting / cuts","Editing","Editing","Editing","Light Edit"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Learning","—","Color grading, audio","Learning","Study","Practice","Baking"]},
+        {"start":"17:00","end":"18:00","activities":["Editing Block II","—","Reels / Sound Sync","Upload","Polish","Export","Publish"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection","Reflection","Reflection","Reflection","Reflection","Rest","Rest"]},
+    ],
+
+    "📊 Base + Excel Automation Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:30","activities":["Excel Automation I","—","Formula & Logic","Excel","Excel","Excel","Light Excel"]},
+        {"start":"09:30","end":"11:00","activities":["Learning / Macro Study","Learning","VBA Practice","Dashboards","Testing","Baking","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Excel Automation II","—","File testing","Excel","Excel","Excel","Debug"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Cleaning","Learning","Help Brother","Cleaning","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
+    ],
+
+    "🧠 Base + Front-End Development Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Reflection / Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Rest"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"11:00","activities":["Front-End Dev I","—","HTML/CSS structure","Coding","UI Setup","Layout Design","Component Study"]},
+        {"start":"11:00","end":"12:00","activities":["Cleaning / Laundry","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Front-End Dev II","—","React / UX polish","Practice","Data Binding","Responsive Design","Debug"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Review / Project Journal","Reflection","Reading","Reflection","Review","Rest","Rest"]},
+    ],
+
+    "🐍 Base + Database Integration Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"13:00","activities":["DB Integration Deep Block (4h)","—","SQL + Python connectors","Coding","Testing","CRUD Building","Query Writing"]},
+        {"start":"13:00","end":"14:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"14:00","end":"15:30","activities":["Learning","—","Schema design","Data flow","Learning","Reading","Practice"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Cleaning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Code Notes","Reflection","Reflection","Reflection","Reflection","Rest","Rest"]},
+    ],
+
+    "⚙️ Base + File Automation Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Light Stretch","Reflection"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"11:00","activities":["Automation Block I","—","Python scripting","Coding","Coding","Coding","Testing"]},
+        {"start":"11:00","end":"12:00","activities":["Cleaning / Organizing","Cleaning","Cleaning","Cleaning","Cleaning","Cleaning","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Automation Block II","—","File management logic","File Ops","Export","Script Format","Tool Debug"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Review","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
+    ],
+
+    "🎥 Base + YouTube & Facebook Channel Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"11:00","activities":["Planning / Scripting Videos","Planning","Scripting","Voice Notes","Storyboard","Planning","—"]},
+        {"start":"11:00","end":"12:00","activities":["Cleaning / Setup","Cleaning","Setup","Cleaning","Setup","Cleaning","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Editing / Filming","—","Long edit session","Edit","Film","Edit","—"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:30","activities":["Upload & Analytics Review","Upload","Community","Upload","Comments","Review","Rest"]},
+    ],
+
+    "📱 Base + TikTok / Instagram Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Rest"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Reflection"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"10:30","activities":["Content Ideation / Trends","Ideas","Concepts","Trends","Hooks","Planning","—"]},
+        {"start":"10:30","end":"12:00","activities":["Cleaning / Filming Setup","Cleaning","Setup","Cleaning","Setup","Cleaning","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"15:00","activities":["Filming + Editing","Reels","Film","Edit","Film","Edit","Film"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Post & Engage","—","Upload / Comments","Post","Engage","Post","Review"]},
+    ],
+
+    "💸 Base + Digital Product Sales Frame": [
+        {"start":"07:00","end":"07:30","activities":["Devotion","Devotion","Devotion","Devotion","Devotion","Devotion","Reflection"]},
+        {"start":"07:30","end":"08:00","activities":["Callisthenics","Callisthenics","Callisthenics","Callisthenics","Callisthenics","Stretch","Rest"]},
+        {"start":"08:00","end":"09:00","activities":["Cooking (Breakfast)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"09:00","end":"10:30","activities":["Product Creation / Design","Product Design","Product Design","Product","—","—","—"]},
+        {"start":"10:30","end":"11:30","activities":["Cleaning / Upload Prep","Cleaning","Prep","Cleaning","Prep","Cleaning","—"]},
+        {"start":"12:00","end":"13:00","activities":["Cooking (Lunch)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"13:00","end":"14:30","activities":["Listing / Marketing","Copy Upload","SEO","Pricing","Thumbnails","Ads","—"]},
+        {"start":"14:30","end":"16:00","activities":["Shop Maintenance / Analytics","Review","Updates","Review","Updates","Review","—"]},
+        {"start":"16:00","end":"17:00","activities":["Help Brother","Learning","Help Brother","Learning","Help Brother","Family","Planning"]},
+        {"start":"17:00","end":"17:45","activities":["Cooking (Dinner)","Cooking","Cooking","Cooking","Cooking","Cooking","—"]},
+        {"start":"18:00","end":"19:00","activities":["Reflection / Sales Notes","Reflection","Reflection","Reflection","Review","Rest","Rest"]},
+    ],
+
+}
+
+# -----------------------------
+# Normalisation (lazy)
+# Frames are converted to schedule_model.Frame on first access rather than at import,
+# so startup doesn't pay for frames nobody looks at.
+# -----------------------------
+class LazyMapping(Mapping):
+    """Read-only mapping over the keys of `source`; each value is built by `build(key)` on first access."""
+
+    def __init__(self, source, build):
+        self._source = source
+        self._build = build
+        self._built = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._built[key]
+        except KeyError:
+            if key not in self._source:
+                raise
+        value = self._built[key] = self._build(key)
+        return value
+
+    def __iter__(self):
+        return iter(self._source)
+
+    def __len__(self):
+        return len(self._source)
+
+    def built(self) -> dict:
+        """The values built so far, by key (a copy; builds nothing)."""
+        return dict(self._built)
+
+    def invalidate(self, keys):
+        """Forget the built values for `keys`; they are rebuilt from `source` on next access."""
+        for key in keys:
+            self._built.pop(key, None)
+
+# frame name -> Frame: the built-in frames above plus any schedule files (which win
+# on a name clash). The schedule directory is only scanned when the frame list is first needed.
+BUILTIN_FRAMES = LazyMapping(RAW_FRAMES, lambda frame_name: normalise_periods(RAW_FRAMES[frame_name], frame_name))
+SCHEDULE_STORE = ScheduleStore(SCHEDULE_DIR, os.path.join(CACHE_DIR, "schedules"))
+FRAMES = ChainMap(SCHEDULE_STORE, BUILTIN_FRAMES)
+
+# -----------------------------
+# Compiled schedule index
+# Built once per frame at load time. Activities are resolved per weekday up front and
+# lookups bisect the sorted arrays instead of scanning every period on every tick.
+# -----------------------------
+DAY_MINUTES = 24*60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+# "HH:MM" texts are shared by every index: there are at most 2 x 1441 of them
+_START_TEXT = {}
+_END_TEXT = {}
+
+class _Days(dict):
+    """days[weekday_index] -> tuple of (start, end, activity), one per period; each weekday's
+    tuple is built the first time it is asked for (and after that is a plain dict hit)."""
+
+    def __init__(self, start_texts, end_texts, activities):
+        super().__init__()
+        self._start_texts = start_texts
+        self._end_texts = end_texts
+        self._activities = activities
+
+    def __missing__(self, weekday_index):
+        if not 0 <= weekday_index < 7:
+            raise IndexError("weekday index out of range")
+        day = self[weekday_index] = tuple(
+            (st, et, row[weekday_index]) for st, et, row in zip(self._start_texts, self._end_texts, self._activities))
+        return day
+
+class FrameIndex:
+    """Week-circular lookup table for one Frame (periods sorted by start_min).
+
+    Every period is laid out once per weekday on a minute-of-week axis (Mon 00:00 = 0,
+    10,080 minutes), carrying that day's activity. Overnight periods run on past midnight
+    into the next day, Sunday night wraps round into Monday, and prev/next are the
+    neighbouring entries on the axis, so they cross day and week boundaries.
+
+    The minute columns are array('i'); the (start, end, activity) tuples are only made
+    for the weekdays that get looked at, and week entry j is days[j // n][j % n].
+    """
+
+    def __init__(self, frame):
+        n = self.n_periods = len(frame)
+        start_texts = [_START_TEXT.get(s) or _START_TEXT.setdefault(s, format_hm(s)) for s in frame.starts]
+        end_texts = [_END_TEXT.get(e) or _END_TEXT.setdefault(e, format_end(e)) for e in frame.ends]
+        # days[weekday_index] -> tuple of (start, end, activity), one per period
+        self.days = _Days(start_texts, end_texts, frame.activities)
+        # week entry j = weekday_index * n + period, in start order
+        self.n_entries = 7 * n
+        week_starts = [d * DAY_MINUTES + s for d in range(7) for s in frame.starts]
+        week_ends = [d * DAY_MINUTES + e for d in range(7) for e in frame.ends]
+        # last week's Sunday goes in front, so a Sunday-night period still covers Monday morning
+        self.starts = array("i", [s - WEEK_MINUTES for s in week_starts[7*n - n:]] + week_starts)
+        self.ends = ends = array("i", [e - WEEK_MINUTES for e in week_ends[7*n - n:]] + week_ends)
+        # running max of end: the first entry whose end lies after `now` is the same one a
+        # linear scan would stop at, even if periods overlap
+        self.max_ends = array("i", accumulate(ends, max))
+        # every minute at which the current/prev/next answer can change (incl. next Monday's first start)
+        self.boundaries = array("i", sorted(set(self.starts) | set(ends) | {s + WEEK_MINUTES for s in week_starts[:n]}))
+
+    def _locate(self, week_minute: int):
+        """(week entry index, is current) for the entry containing week_minute or the next one after it."""
+        k = bisect_right(self.max_ends, week_minute)
+        current = k < len(self.starts) and self.starts[k] <= week_minute
+        return (k - self.n_periods) % self.n_entries, current
+
+    def locate(self, now_minute: int, weekday_index: int):
+        """(week entry index, is current) for now -- the entry containing it, or else the next
+        one -- or None for an empty frame. The entry's neighbours are prev and next."""
+        if not self.n_entries:
+            return None
+        return self._locate((weekday_index * DAY_MINUTES + now_minute) % WEEK_MINUTES)
+
+    def entry(self, j: int):
+        """Week entry j as (start, end, activity); j wraps round the week."""
+        n = self.n_periods
+        j %= self.n_entries
+        return self.days[j // n][j % n]
+
+    def lookup_week(self, week_minute: int):
+        """Return (prev_entry, curr_entry, next_entry) for a minute of the week, in O(log n)."""
+        if not self.n_entries:
+            return None, None, None
+        j, current = self._locate(week_minute % WEEK_MINUTES)
+        n, days = self.n_periods, self.days
+        d, p = divmod(j, n)
+        prev_entry = days[d][p - 1] if p else days[(d - 1) % 7][-1]
+        if not current:
+            return prev_entry, None, days[d][p]
+        next_entry = days[d][p + 1] if p + 1 < n else days[(d + 1) % 7][0]
+        return prev_entry, days[d][p], next_entry
+
+    def lookup(self, now_minute: int, weekday_index: int):
+        """Return (prev_entry, curr_entry, next_entry); see CreativeWatch.find_prev_curr_next."""
+        return self.lookup_week(weekday_index * DAY_MINUTES + now_minute)
+
+    def current_entry(self, week_minute: int):
+        """Week entry index (weekday_index * n_periods + period) active at week_minute, or None."""
+        if not self.n_entries:
+            return None
+        j, current = self._locate(week_minute % WEEK_MINUTES)
+        return j if current else None
+
+    def current_index(self, now_minute: int, weekday_index: int):
+        """Index into days[weekday_index] of the current period, or None (also when the current
+        period is yesterday's, running on past midnight)."""
+        j = self.current_entry(weekday_index * DAY_MINUTES + now_minute)
+        if j is None or j // self.n_periods != weekday_index:
+            return None
+        return j % self.n_periods
+
+    def next_boundary(self, now_minute: int, weekday_index: int):
+        """Next period start/end after now, in minutes from today's midnight (may be past 1440),
+        or None for an empty frame."""
+        base = weekday_index * DAY_MINUTES
+        i = bisect_right(self.boundaries, base + now_minute)
+        return self.boundaries[i] - base if i < len(self.boundaries) else None
+
+# frame name -> FrameIndex, compiled on first access
+FRAME_INDEX = LazyMapping(FRAMES, lambda frame_name: FrameIndex(FRAMES[frame_name]))
+
+# -----------------------------
+# Transition timeline
+# Upcoming starts, ends and pre-alerts of one frame as a heap of datetimes, so the GUI can
+# sleep until the next one instead of asking the index every second for every lead time.
+# -----------------------------
+class TransitionTimeline:
+    """Events of one FrameIndex from now to `days` days ahead.
+
+    Events are (when, kind, entry, lead): kind is "start", "end" or "alert", entry is the
+    (start, end, activity) of the period and lead the alert's minutes before its start
+    (0 for start/end). The horizon moves forward a day at a time as events are popped,
+    so a day rollover only adds the day that came into view.
+    """
+
+    # at the same minute: ends before starts before alerts
+    _ORDER = {"end": 0, "start": 1, "alert": 2}
+
+    def __init__(self, index, now: datetime, days: int = 2, leads=()):
+        self.index = index
+        self.days = days
+        self.leads = tuple(sorted(set(leads)))
+        self._heap = []
+        self._seq = count()
+        # start a day early: yesterday's overnight periods end today
+        self._horizon = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        self._extend(now)
+        while self._heap and self._heap[0][0] <= now:
+            heapq.heappop(self._heap)
+
+    def _add_day(self, day: datetime):
+        index = self.index
+        n = index.n_periods
+        weekday_index = day.weekday()
+        base = weekday_index * DAY_MINUTES
+        for p, entry in enumerate(index.days[weekday_index]):
+            j = n + weekday_index * n + p  # position in the extended starts/ends
+            start = day + timedelta(minutes=index.starts[j] - base)
+            end = day + timedelta(minutes=index.ends[j] - base)
+            self._push(end, "end", entry, 0)
+            self._push(start, "start", entry, 0)
+            for lead in self.leads:
+                self._push(start - timedelta(minutes=lead), "alert", entry, lead)
+
+    def _push(self, when, kind, entry, lead):
+        heapq.heappush(self._heap, (when, self._ORDER[kind], next(self._seq), kind, entry, lead))
+
+    def _extend(self, now: datetime):
+        last_day = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=self.days)
+        while self._horizon <= last_day:
+            self._add_day(self._horizon)
+            self._horizon += timedelta(days=1)
+
+    def next_time(self):
+        """When the earliest pending event is due, or None if there is none."""
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime):
+        """Remove and return every event due at or before `now`, oldest first."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, _, kind, entry, lead = heapq.heappop(self._heap)
+            due.append((when, kind, entry, lead))
+        self._extend(now)
+        return due
+
+# -----------------------------
+# Queries
+# -----------------------------
+def resolve_frame(query: str) -> str:
+    """Frame name for `query`: an exact name, or a case-insensitive fragment matching exactly one frame."""
+    if query in FRAMES:
+        return query
+    needle = query.casefold()
+    matches = [frame_name for frame_name in FRAMES if needle in frame_name.casefold()]
+    if len(matches) == 1:
+        return matches[0]
+    if not matches:
+        raise KeyError(f"no frame matches {query!r}")
+    raise KeyError(f"{query!r} matches {len(matches)} frames: " + ", ".join(matches))
+
+def reload_frames():
+    """Re-read schedule files that changed on disk (see ScheduleStore.poll).
+
+    Returns (changed frame names, [(source, mtime_ns)] re-read). Only the changed frames'
+    indexes are dropped; FRAME_INDEX rebuilds each one the next time it is asked for.
+    """
+    changed, reread = SCHEDULE_STORE.poll()
+    FRAME_INDEX.invalidate(changed)
+    return changed, reread
+
+def find_prev_curr_next(frame_name: str, now_minute: int, weekday_index: int):
+    """Return (prev_entry, curr_entry, next_entry) for a frame; entries are (start, end, activity) or None."""
+    return FRAME_INDEX[frame_name].lookup(now_minute, weekday_index)
+
+def query_at(frame_name: str, when: datetime):
+    """find_prev_curr_next for the local wall-clock time `when`."""
+    return FRAME_INDEX[frame_name].lookup(when.hour * 60 + when.minute, when.weekday())
+
+def day_entries(frame_name: str, weekday_index: int):
+    """All (start, end, activity) entries of a frame for one weekday (Mon=0), in order."""
+    return FRAME_INDEX[frame_name].days[weekday_index]
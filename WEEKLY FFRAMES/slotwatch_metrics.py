@@ -0,0 +1,156 @@
+"""
+slotwatch_metrics.py
+Opt-in runtime metrics for the watch: tick lateness, update_display and lookup durations,
+Tk redraws (config calls that reached Tk) and process RSS, one sample per tick in a ring
+buffer. Summaries go to an on-screen overlay (slotwatch2.py) and, periodically, to a
+JSON-lines file or a Prometheus text file (by extension: .prom), written atomically so a
+local scraper never reads half a file.
+
+Nothing here runs unless the GUI is started with --metrics; the GUI's only cost when it
+is off is an `is None` check per tick.
+"""
+
+import json
+import os
+import sys
+from collections import deque
+from time import perf_counter, time
+
+try:
+    import psutil  # only used where /proc isn't available (Windows, macOS)
+except ImportError:
+    psutil = None
+
+# -----------------------------
+# Process memory
+# -----------------------------
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def rss_bytes():
+    """Resident set size of this process, or None if it can't be read here."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+# -----------------------------
+# Ring buffer
+# -----------------------------
+def _quantile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] if sorted_values else None
+
+class Metrics:
+    """Per-tick samples: (unix time, lateness s, update_display s or None, lookup s or None, redraws, rss)."""
+
+    def __init__(self, capacity: int = 3600):
+        self.samples = deque(maxlen=capacity)
+        self.ticks = 0
+        self.redraws_total = 0
+        self.lateness_sum = 0.0
+        # durations measured since the last sample (by update_display, which may also run
+        # outside a tick: frame switch, Refresh Now); taken by the next record()
+        self.update_s = None
+        self.lookup_s = None
+        self._due = None
+
+    def arm(self, delay_ms: int):
+        """The tick was re-armed to fire `delay_ms` from now."""
+        self._due = perf_counter() + delay_ms / 1000
+
+    def record(self, started: float, redraws: int):
+        """One tick that began at perf_counter() value `started` and sent `redraws` configs to Tk."""
+        lateness = max(0.0, started - self._due) if self._due is not None else 0.0
+        self.samples.append((time(), lateness, self.update_s, self.lookup_s, redraws, rss_bytes()))
+        self.update_s = self.lookup_s = None
+        self.ticks += 1
+        self.redraws_total += redraws
+        self.lateness_sum += lateness
+
+    def summary(self, last: int = None) -> dict:
+        """Stats over the newest `last` samples (default: the whole buffer)."""
+        samples = list(self.samples)[-last:] if last else list(self.samples)
+        lateness = sorted(s[1] for s in samples)
+        updates = [s[2] for s in samples if s[2] is not None]
+        lookups = [s[3] for s in samples if s[3] is not None]
+        span = samples[-1][0] - samples[0][0] if len(samples) > 1 else 0.0
+        redraws = sum(s[4] for s in samples)
+        return {
+            "ts": round(time(), 3),
+            "samples": len(samples),
+            "ticks_total": self.ticks,
+            "redraws_total": self.redraws_total,
+            "lateness_sum_s": self.lateness_sum,
+            "tick_lateness_s": {"p50": _quantile(lateness, 0.5), "p95": _quantile(lateness, 0.95),
+                                "p99": _quantile(lateness, 0.99), "max": lateness[-1] if lateness else None},
+            "update_display_s": {"count": len(updates), "mean": sum(updates) / len(updates) if updates else None,
+                                 "max": max(updates, default=None)},
+            "lookup_s": {"count": len(lookups), "mean": sum(lookups) / len(lookups) if lookups else None,
+                         "max": max(lookups, default=None)},
+            "redraws": redraws,
+            "redraws_per_s": redraws / span if span else None,
+            "rss_bytes": samples[-1][5] if samples else None,
+        }
+
+    def overlay_text(self, last: int = 60) -> str:
+        s = self.summary(last)
+        ms = lambda v: "-" if v is None else f"{v * 1000:.1f}"
+        us = lambda v: "-" if v is None else f"{v * 1e6:.1f}"
+        late, update, lookup = s["tick_lateness_s"], s["update_display_s"], s["lookup_s"]
+        rss = "-" if s["rss_bytes"] is None else f"{s['rss_bytes'] / 2**20:.1f} MiB"
+        rate = "-" if s["redraws_per_s"] is None else f"{s['redraws_per_s']:.2f}/s"
+        return (f"tick late  p50 {ms(late['p50'])}  p95 {ms(late['p95'])}  max {ms(late['max'])} ms\n"
+                f"update     mean {ms(update['mean'])}  max {ms(update['max'])} ms  (n={update['count']})\n"
+                f"lookup     mean {us(lookup['mean'])}  max {us(lookup['max'])} µs\n"
+                f"redraws    {s['redraws']} in last {s['samples']} ticks ({rate})\n"
+                f"rss        {rss}   ticks {s['ticks_total']}")
+
+    # -----------------------------
+    # Export
+    # -----------------------------
+    def export(self, path: str, last: int = None):
+        """Append a JSON line to `path`, or rewrite it as Prometheus text if it ends in .prom."""
+        summary = self.summary(last)
+        try:
+            if path.endswith(".prom"):
+                tmp_file = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(prometheus_text(summary))
+                os.replace(tmp_file, path)
+            else:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(summary) + "\n")
+        except OSError as exc:
+            print(f"metrics export failed: {exc}", file=sys.stderr)
+
+def prometheus_text(summary: dict) -> str:
+    """Prometheus text exposition of a Metrics.summary()."""
+    lines = []
+
+    def metric(name, kind, help_text, values):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in values:
+            if value is not None:
+                lines.append(f"{name}{labels} {value}")
+
+    late = summary["tick_lateness_s"]
+    metric("slotwatch_ticks_total", "counter", "Clock ticks run.", [("", summary["ticks_total"])])
+    metric("slotwatch_redraws_total", "counter", "Widget config calls that reached Tk.",
+           [("", summary["redraws_total"])])
+    metric("slotwatch_tick_lateness_seconds", "summary", "How late each tick fired after its wall-clock second.",
+           [('{quantile="0.5"}', late["p50"]), ('{quantile="0.95"}', late["p95"]),
+            ('{quantile="0.99"}', late["p99"]), ("_sum", summary["lateness_sum_s"]),
+            ("_count", summary["ticks_total"])])
+    metric("slotwatch_tick_lateness_max_seconds", "gauge", "Worst tick lateness in the export window.",
+           [("", late["max"])])
+    for key, name, what in (("update_display_s", "slotwatch_update_display_seconds", "update_display"),
+                            ("lookup_s", "slotwatch_lookup_seconds", "prev/current/next lookup")):
+        stats = summary[key]
+        metric(name, "gauge", f"{what} duration in the export window.",
+               [('{stat="mean"}', stats["mean"]), ('{stat="max"}', stats["max"])])
+    metric("slotwatch_rss_bytes", "gauge", "Process resident set size.", [("", summary["rss_bytes"])])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,189 @@
+"""
+week_timeline.py
+Minute-of-week x frame lookup table for reporting across many frames at once.
+
+WeekTimeline.table[minute_of_week, frame_pos] is the week entry active at that minute
+(Mon 00:00 = minute 0, 10,080 minutes per week), or -1 when nothing is scheduled. As in
+FrameIndex, week entry j is period j % n_periods as laid out on weekday j // n_periods, so
+an overnight period keeps the activity of the day it started on, and Sunday night wraps
+round into Monday morning. With NumPy the table is built for every frame in one vectorized
+searchsorted; without it, an array column per frame is filled from FrameIndex instead.
+Both give the same answers.
+
+The reports (activity minutes per week, free time per day, side-by-side comparison) are
+all answered from the table, never by calling the lookup per minute.
+"""
+
+from array import array
+from itertools import groupby
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from slotwatch_engine import DAY_MINUTES, FRAMES, WEEK_MINUTES, FrameIndex
+
+# > span of one frame's keys (-1440 .. 6*1440 + 2*1440): keeps each frame's keys in its own range
+_KEY_STRIDE = 16384
+
+class WeekTimeline:
+    """Week entry index for every (minute of week, frame); see the module docstring."""
+
+    def __init__(self, frames=None, frame_names=None, use_numpy=None):
+        frames = FRAMES if frames is None else frames
+        self.frame_names = list(frames if frame_names is None else frame_names)
+        self.frames = [frames[frame_name] for frame_name in self.frame_names]
+        self.use_numpy = (np is not None) if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise RuntimeError("numpy is not installed")
+
+        # global activity string table; activity_ids[frame_pos][period][weekday] -> id
+        ids = {}
+        self.activity_ids = []
+        for frame in self.frames:
+            rows = []
+            for row in frame.activities:
+                rows.append(tuple(ids.setdefault(a, len(ids)) for a in row))
+            self.activity_ids.append(rows)
+        self.activity_names = list(ids)
+
+        self._pos = {frame_name: pos for pos, frame_name in enumerate(self.frame_names)}
+        self.table = self._build_numpy() if self.use_numpy else self._build_arrays()
+
+    # -----------------------------
+    # Build
+    # -----------------------------
+    def _dtype_code(self):
+        # int16 unless some frame has more than 32767 week entries
+        return "h" if max((7 * len(frame) for frame in self.frames), default=0) < 2**15 else "l"
+
+    def _build_numpy(self):
+        n_frames = len(self.frames)
+        dtype = np.int16 if self._dtype_code() == "h" else np.int32
+        counts = np.array([len(frame) for frame in self.frames], dtype=np.int64)
+        total = int(counts.sum())
+        if not total:
+            return np.full((WEEK_MINUTES, n_frames), -1, dtype=dtype)
+        first = np.cumsum(counts) - counts
+        starts = np.concatenate([np.asarray(frame.starts, dtype=np.int64) for frame in self.frames])
+        ends = np.concatenate([np.asarray(frame.ends, dtype=np.int64) for frame in self.frames])
+        frame_of_period = np.repeat(np.arange(n_frames, dtype=np.int64), counts)
+        local = np.arange(total, dtype=np.int64) - first[frame_of_period]
+
+        # FrameIndex's layout for every frame at once: per frame, 8 blocks of its periods --
+        # last week's Sunday, then Monday..Sunday -- each shifted to its day on the week axis
+        ext_starts = np.empty(8 * total, dtype=np.int64)
+        ext_ends = np.empty(8 * total, dtype=np.int64)
+        ext_frame = np.empty(8 * total, dtype=np.int64)
+        for block in range(8):
+            pos = 8 * first[frame_of_period] + block * counts[frame_of_period] + local
+            ext_starts[pos] = starts + (block - 1) * DAY_MINUTES
+            ext_ends[pos] = ends + (block - 1) * DAY_MINUTES
+            ext_frame[pos] = frame_of_period
+        # running max of end per frame (as FrameIndex.max_ends): the stride keeps frames apart,
+        # so one global accumulate and one searchsorted serve every frame and minute
+        keys = np.maximum.accumulate(ext_ends + ext_frame * _KEY_STRIDE)
+        minutes = np.arange(WEEK_MINUTES, dtype=np.int64)
+        frame_ids = np.arange(n_frames, dtype=np.int64)
+        hit = np.searchsorted(keys, (frame_ids[:, None] * _KEY_STRIDE + minutes).ravel(), side="right")
+        n = np.repeat(counts, WEEK_MINUTES)
+        k = hit - np.repeat(8 * first, WEEK_MINUTES)
+        current = (k < 8 * n) & (ext_starts[np.minimum(hit, 8 * total - 1)] <= np.tile(minutes, n_frames))
+        j = np.where(current, (k - n) % np.maximum(7 * n, 1), -1)
+        return np.ascontiguousarray(j.astype(dtype).reshape(n_frames, WEEK_MINUTES).T)
+
+    def _build_arrays(self):
+        code = self._dtype_code()
+        columns = []
+        for frame in self.frames:
+            index = FrameIndex(frame)
+            columns.append(array(code, [-1 if j is None else j
+                                        for j in map(index.current_entry, range(WEEK_MINUTES))]))
+        return columns
+
+    # -----------------------------
+    # Lookups
+    # -----------------------------
+    def column(self, frame_name):
+        """Period index per minute of the week for one frame."""
+        pos = self._pos[frame_name]
+        return self.table[:, pos] if self.use_numpy else self.table[pos]
+
+    def entry_at(self, frame_name, minute_of_week: int) -> int:
+        """Week entry (weekday * n_periods + period) active at a minute of the week, or -1."""
+        return int(self.column(frame_name)[minute_of_week])
+
+    def activity_at(self, frame_name, minute_of_week: int):
+        """Activity at a minute of the week, or None when unscheduled."""
+        pos = self._pos[frame_name]
+        return self._activity(pos, self.entry_at(frame_name, minute_of_week))
+
+    def _activity(self, pos, entry):
+        if entry < 0:
+            return None
+        n = len(self.frames[pos])
+        return self.activity_names[self.activity_ids[pos][entry % n][entry // n]]
+
+    # -----------------------------
+    # Reports
+    # -----------------------------
+    def activity_minutes(self):
+        """{frame name: {activity: scheduled minutes per week}}."""
+        n_acts = len(self.activity_names)
+        if self.use_numpy:
+            n_frames = len(self.frames)
+            # one (total periods x 7) id matrix for every frame, addressed by global period number
+            flat = [row for rows in self.activity_ids for row in rows]
+            ids = np.array(flat, dtype=np.int64).reshape(-1, 7)
+            counts = np.array([len(f) for f in self.frames], dtype=np.int64)
+            first = np.cumsum(counts) - counts
+            minute, pos = np.nonzero(self.table >= 0)
+            entry = self.table[minute, pos].astype(np.int64)
+            act = ids[first[pos] + entry % counts[pos], entry // counts[pos]]
+            counts = np.bincount(pos * n_acts + act, minlength=n_frames * n_acts).reshape(n_frames, n_acts)
+            return {frame_name: {self.activity_names[a]: int(counts[p, a]) for a in np.nonzero(counts[p])[0]}
+                    for p, frame_name in enumerate(self.frame_names)}
+        result = {}
+        for pos, frame_name in enumerate(self.frame_names):
+            totals = {}
+            for entry, run in groupby(self.table[pos]):
+                if entry >= 0:
+                    name = self._activity(pos, entry)
+                    totals[name] = totals.get(name, 0) + len(list(run))
+            result[frame_name] = totals
+        return result
+
+    def free_minutes_per_day(self):
+        """{frame name: [unscheduled minutes Mon..Sun]}."""
+        if self.use_numpy:
+            free = (self.table < 0).reshape(7, DAY_MINUTES, len(self.frames)).sum(axis=1)
+            return {frame_name: [int(m) for m in free[:, p]] for p, frame_name in enumerate(self.frame_names)}
+        return {frame_name: [sum(1 for i in self.table[p][d * DAY_MINUTES:(d + 1) * DAY_MINUTES] if i < 0)
+                             for d in range(7)]
+                for p, frame_name in enumerate(self.frame_names)}
+
+    def compare(self, frame_names, weekday: int):
+        """Side-by-side view of one weekday.
+
+        Returns [(start_min, end_min, (activity or None, per frame))], one entry per stretch
+        of the day in which none of `frame_names` moves to another period.
+        """
+        positions = [self._pos[frame_name] for frame_name in frame_names]
+        base = weekday * DAY_MINUTES
+        activity = self._activity
+
+        if self.use_numpy:
+            sub = self.table[base:base + DAY_MINUTES, positions]
+            changes = np.nonzero((sub[1:] != sub[:-1]).any(axis=1))[0] + 1
+            cuts = [0, *changes.tolist(), DAY_MINUTES]
+            return [(s, e, tuple(activity(pos, int(sub[s, k])) for k, pos in enumerate(positions)))
+                    for s, e in zip(cuts, cuts[1:])]
+        columns = [self.table[pos][base:base + DAY_MINUTES] for pos in positions]
+        segments = []
+        start = 0
+        for m in range(1, DAY_MINUTES + 1):
+            if m == DAY_MINUTES or any(c[m] != c[m - 1] for c in columns):
+                segments.append((start, m, tuple(activity(pos, c[start]) for pos, c in zip(positions, columns))))
+                start = m
+        return segments